@@ -1,6 +1,7 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/functional.h>
+#include <pybind11/numpy.h>
 
 #include "rng.hpp"
 #include "payoff.hpp"
@@ -8,6 +9,7 @@
 #include "bs_analytical.hpp"
 
 #include <memory>
+#include <mutex>
 #include <string>
 
 namespace py = pybind11;
@@ -39,6 +41,7 @@ struct PricingConfig
     double control_strike{0.0};  // Control strike (0.0 = auto: use same strike as K)
     std::size_t n_threads{0};   // Number of threads (0 = auto-detect)
     std::string option_type{"call"}; // "call" or "put"
+    std::string dtype{"float64"};    // Path simulation precision: "float64" or "float32"
 };
 
 // Wrapper class for Python interface
@@ -53,9 +56,21 @@ public:
         pricer_ = std::make_unique<MonteCarloPricer>(*rng_);
     }
 
+    // Restart the random stream as if freshly constructed with `seed`
+    // (0 = random seed), without rebuilding the pricer
+    void reset_seed(uint64_t seed = 0)
+    {
+        if (seed == 0)
+            seed = std::random_device{}();
+        std::lock_guard<std::recursive_mutex> lock(mutex_);
+        rng_->seed(seed);
+    }
+
     // Simple price_mc interface
     PricingResult price_mc(const PricingConfig& config)
     {
+        std::lock_guard<std::recursive_mutex> lock(mutex_);
+        require_float64(config, "price_mc");
         auto payoff = create_payoff(config);
         
         if (config.use_control_variate)
@@ -83,33 +98,116 @@ public:
     // Parallel price_mc interface
     PricingResult price_mc_parallel(const PricingConfig& config)
     {
+        std::lock_guard<std::recursive_mutex> lock(mutex_);
+        return run_mc_parallel(config, nullptr);
+    }
+
+    // Parallel price_mc that writes terminal prices into a caller-owned buffer,
+    // letting benchmark sweeps reuse a single allocation across calls
+    PricingResult price_mc_parallel_preallocated(const PricingConfig& config,
+                                                 py::array_t<float, py::array::c_style> buf)
+    {
+        if (!buf.writeable())
+            throw std::runtime_error("Buffer is read-only");
+        if (static_cast<std::size_t>(buf.size()) < config.n_paths)
+            throw std::runtime_error("Buffer too small: need " + std::to_string(config.n_paths) +
+                                     " elements, got " + std::to_string(buf.size()));
+
+        // Take the pointer while holding the GIL; the array stays alive for the call
+        float* terminal_out = buf.mutable_data();
+        py::gil_scoped_release release;
+        std::lock_guard<std::recursive_mutex> lock(mutex_);
+        return run_mc_parallel(config, terminal_out);
+    }
+
+    // Price several (use_antithetic, use_control_variate) variants from one set of paths.
+    // config.use_antithetic / use_control_variate are ignored in favour of `variants`.
+    std::vector<PricingResult> price_mc_multi(const PricingConfig& config,
+                                              const std::vector<std::pair<bool, bool>>& variants)
+    {
+        std::lock_guard<std::recursive_mutex> lock(mutex_);
         auto payoff = create_payoff(config);
-        
-        if (config.use_control_variate)
+
+        std::vector<EstimatorVariant> estimator_variants;
+        bool any_control_variate = false;
+        for (const auto& variant : variants)
+        {
+            estimator_variants.push_back({variant.first, variant.second});
+            any_control_variate = any_control_variate || variant.second;
+        }
+
+        if (any_control_variate)
         {
             auto control_payoff = create_control_payoff(config);
             double control_analytical = compute_control_analytical_price(config);
-            
-            return pricer_->price_by_mc_parallel(
+
+            return pricer_->price_by_mc_parallel_multi(
                 *payoff, config.S0, config.r, config.sigma, config.T,
-                config.n_paths, config.confidence_level,
-                config.use_antithetic, config.use_control_variate,
-                control_payoff.get(), control_analytical, config.n_threads
+                config.n_paths, estimator_variants, config.confidence_level,
+                control_payoff.get(), control_analytical, config.n_threads,
+                parse_precision(config)
             );
         }
         else
         {
-            return pricer_->price_by_mc_parallel(
+            return pricer_->price_by_mc_parallel_multi(
                 *payoff, config.S0, config.r, config.sigma, config.T,
-                config.n_paths, config.confidence_level,
-                config.use_antithetic, false, nullptr, 0.0, config.n_threads
+                config.n_paths, estimator_variants, config.confidence_level,
+                nullptr, 0.0, config.n_threads, parse_precision(config)
             );
         }
     }
 
+    // Price the call and the put with strike K from the same simulated paths.
+    // Returns (call_result, put_result); the paths are simulated in float64.
+    std::pair<PricingResult, PricingResult> price_mc_parallel_both(const PricingConfig& config)
+    {
+        std::lock_guard<std::recursive_mutex> lock(mutex_);
+        if (config.use_control_variate)
+            throw std::runtime_error("price_mc_parallel_both does not support control variates");
+        require_float64(config, "price_mc_parallel_both");
+
+        auto call_payoff = make_call(config.K);
+        auto put_payoff = make_put(config.K);
+
+        auto results = pricer_->price_by_mc_parallel_payoffs(
+            {call_payoff.get(), put_payoff.get()}, config.S0, config.r, config.sigma, config.T,
+            config.n_paths, config.confidence_level, config.use_antithetic, config.n_threads
+        );
+        return {results[0], results[1]};
+    }
+
+    // Path-count convergence from one run: one PricingResult per checkpoint, each
+    // using the first `checkpoint` paths of a single max(checkpoints)-path sweep.
+    // config.n_paths is ignored; control variates are not supported.
+    std::vector<PricingResult> price_mc_parallel_checkpoints(const PricingConfig& config,
+                                                             const std::vector<std::size_t>& checkpoints)
+    {
+        std::lock_guard<std::recursive_mutex> lock(mutex_);
+        if (config.use_control_variate)
+            throw std::runtime_error("price_mc_parallel_checkpoints does not support control variates");
+        if (checkpoints.empty() || checkpoints.front() == 0)
+            throw std::runtime_error("checkpoints must be a non-empty list of positive path counts");
+        for (std::size_t k = 1; k < checkpoints.size(); ++k)
+        {
+            if (checkpoints[k] <= checkpoints[k - 1])
+                throw std::runtime_error("checkpoints must be strictly increasing");
+        }
+
+        auto payoff = create_payoff(config);
+        return pricer_->price_by_mc_parallel_checkpoints(
+            *payoff, config.S0, config.r, config.sigma, config.T, checkpoints,
+            config.confidence_level, config.use_antithetic, config.n_threads,
+            parse_precision(config)
+        );
+    }
+
     // Compute Greeks using finite differences
     Greeks compute_greeks(const PricingConfig& config, bool use_parallel = true)
     {
+        std::lock_guard<std::recursive_mutex> lock(mutex_);
+        if (!use_parallel)
+            require_float64(config, "compute_greeks(use_parallel=False)");
         Greeks greeks;
         
         // Base price
@@ -118,7 +216,7 @@ public:
             price_mc(config).price;
         
         // Delta: dV/dS (first derivative w.r.t. spot)
-        const double dS = config.S0 * 0.01; // 1% bump
+        const double dS = config.S0 * SPOT_BUMP;
         PricingConfig config_up = config;
         config_up.S0 = config.S0 + dS;
         PricingConfig config_down = config;
@@ -133,14 +231,14 @@ public:
         greeks.gamma = (price_up - 2.0 * base_price + price_down) / (dS * dS);
         
         // Vega: dV/dσ (derivative w.r.t. volatility)
-        const double dsigma = 0.01; // 1% bump
+        const double dsigma = VOL_BUMP;
         PricingConfig config_vega = config;
         config_vega.sigma = config.sigma + dsigma;
         double price_vega = use_parallel ? price_mc_parallel(config_vega).price : price_mc(config_vega).price;
         greeks.vega = (price_vega - base_price) / dsigma;
         
         // Theta: dV/dT (derivative w.r.t. time)
-        const double dT = -1.0 / 365.0; // -1 day
+        const double dT = TIME_BUMP;
         PricingConfig config_theta = config;
         config_theta.T = config.T + dT;
         if (config_theta.T > 0)
@@ -150,7 +248,7 @@ public:
         }
         
         // Rho: dV/dr (derivative w.r.t. interest rate)
-        const double dr = 0.01; // 1% bump
+        const double dr = RATE_BUMP;
         PricingConfig config_rho = config;
         config_rho.r = config.r + dr;
         double price_rho = use_parallel ? price_mc_parallel(config_rho).price : price_mc(config_rho).price;
@@ -159,6 +257,80 @@ public:
         return greeks;
     }
 
+    // Same finite differences as compute_greeks, but all bumped prices come from
+    // one parallel sweep on common random numbers (one normal draw per path drives
+    // every bump), which removes most of the noise in the differences.
+    // Control variates are not supported.
+    Greeks compute_greeks_crn(const PricingConfig& config)
+    {
+        std::lock_guard<std::recursive_mutex> lock(mutex_);
+        if (config.use_control_variate)
+            throw std::runtime_error("compute_greeks_crn does not support control variates");
+        require_float64(config, "compute_greeks_crn");
+        Greeks greeks;
+        auto payoff = create_payoff(config);
+
+        const double dS = config.S0 * SPOT_BUMP;
+        const bool has_theta = config.T + TIME_BUMP > 0;
+
+        std::vector<MarketScenario> scenarios = {
+            {config.S0, config.r, config.sigma, config.T},              // base
+            {config.S0 + dS, config.r, config.sigma, config.T},         // spot up
+            {config.S0 - dS, config.r, config.sigma, config.T},         // spot down
+            {config.S0, config.r, config.sigma + VOL_BUMP, config.T},   // vega
+            {config.S0, config.r + RATE_BUMP, config.sigma, config.T},  // rho
+        };
+        if (has_theta)
+            scenarios.push_back({config.S0, config.r, config.sigma, config.T + TIME_BUMP});
+
+        auto results = pricer_->price_by_mc_parallel_crn(
+            *payoff, scenarios, config.n_paths, config.confidence_level,
+            config.use_antithetic, config.n_threads
+        );
+
+        const double base_price = results[0].price;
+        const double price_up = results[1].price;
+        const double price_down = results[2].price;
+
+        greeks.delta = (price_up - price_down) / (2.0 * dS);
+        greeks.gamma = (price_up - 2.0 * base_price + price_down) / (dS * dS);
+        greeks.vega = (results[3].price - base_price) / VOL_BUMP;
+        greeks.rho = (results[4].price - base_price) / RATE_BUMP;
+        if (has_theta)
+            greeks.theta = (results[5].price - base_price) / TIME_BUMP;
+
+        return greeks;
+    }
+
+    // All five Greeks from one parallel sweep: pathwise derivatives for delta,
+    // vega, theta and rho, and the likelihood-ratio method for gamma (the
+    // payoff's derivative is a step, so it can't be differentiated pathwise).
+    // Control variates are not supported.
+    Greeks compute_greeks_pathwise(const PricingConfig& config)
+    {
+        std::lock_guard<std::recursive_mutex> lock(mutex_);
+        if (config.use_control_variate)
+            throw std::runtime_error("compute_greeks_pathwise does not support control variates");
+        if (!(config.sigma > 0.0 && config.T > 0.0))
+            throw std::runtime_error("compute_greeks_pathwise requires sigma > 0 and T > 0");
+        require_float64(config, "compute_greeks_pathwise");
+
+        auto payoff = create_payoff(config);
+        auto results = pricer_->price_by_mc_parallel_pathwise(
+            *payoff, config.S0, config.r, config.sigma, config.T,
+            config.n_paths, config.confidence_level, config.use_antithetic, config.n_threads
+        );
+
+        // results[0] is the price estimate from the same paths
+        Greeks greeks;
+        greeks.delta = results[1].price;
+        greeks.gamma = results[2].price;
+        greeks.vega = results[3].price;
+        greeks.theta = results[4].price;
+        greeks.rho = results[5].price;
+        return greeks;
+    }
+
     // Get analytical price for comparison
     double analytical_price(const PricingConfig& config)
     {
@@ -166,8 +338,64 @@ public:
     }
 
 private:
+    // Finite-difference bump sizes shared by compute_greeks and compute_greeks_crn
+    static constexpr double SPOT_BUMP = 0.01;          // 1% of S0
+    static constexpr double VOL_BUMP = 0.01;           // 1 vol point
+    static constexpr double TIME_BUMP = -1.0 / 365.0;  // -1 day
+    static constexpr double RATE_BUMP = 0.01;          // 1% rate
+
     std::unique_ptr<RNG> rng_;
     std::unique_ptr<MonteCarloPricer> pricer_;
+    // Serialises calls that draw from rng_: with the GIL released, two Python
+    // threads sharing a pricer would otherwise race on the generator state.
+    // Recursive because compute_greeks re-enters price_mc / price_mc_parallel.
+    std::recursive_mutex mutex_;
+
+    PricingResult run_mc_parallel(const PricingConfig& config, float* terminal_out)
+    {
+        auto payoff = create_payoff(config);
+        
+        if (config.use_control_variate)
+        {
+            auto control_payoff = create_control_payoff(config);
+            double control_analytical = compute_control_analytical_price(config);
+            
+            return pricer_->price_by_mc_parallel(
+                *payoff, config.S0, config.r, config.sigma, config.T,
+                config.n_paths, config.confidence_level,
+                config.use_antithetic, config.use_control_variate,
+                control_payoff.get(), control_analytical, config.n_threads,
+                terminal_out, parse_precision(config)
+            );
+        }
+        else
+        {
+            return pricer_->price_by_mc_parallel(
+                *payoff, config.S0, config.r, config.sigma, config.T,
+                config.n_paths, config.confidence_level,
+                config.use_antithetic, false, nullptr, 0.0, config.n_threads,
+                terminal_out, parse_precision(config)
+            );
+        }
+    }
+
+    Precision parse_precision(const PricingConfig& config)
+    {
+        if (config.dtype == "float64")
+            return Precision::Float64;
+        else if (config.dtype == "float32")
+            return Precision::Float32;
+        else
+            throw std::runtime_error("Unknown dtype: " + config.dtype + " (expected 'float64' or 'float32')");
+    }
+
+    // For kernels that only simulate in float64: reject other precisions
+    // instead of silently ignoring config.dtype
+    void require_float64(const PricingConfig& config, const std::string& method)
+    {
+        if (parse_precision(config) != Precision::Float64)
+            throw std::runtime_error(method + " simulates in float64 only (set dtype='float64')");
+    }
 
     std::unique_ptr<Payoff> create_payoff(const PricingConfig& config)
     {
@@ -230,7 +458,8 @@ private:
     }
 };
 
-PYBIND11_MODULE(montecarlo_pricer, m)
+// Built as montecarlo_pricer._core; the package __init__ re-exports it
+PYBIND11_MODULE(_core, m)
 {
     m.doc() = "Monte Carlo Option Pricer with Multi-threading and SIMD optimization";
 
@@ -250,6 +479,11 @@ PYBIND11_MODULE(montecarlo_pricer, m)
         .def_readwrite("control_strike", &PricingConfig::control_strike, "Control variate strike (0.0=auto: use K)")
         .def_readwrite("n_threads", &PricingConfig::n_threads, "Number of threads (0=auto)")
         .def_readwrite("option_type", &PricingConfig::option_type, "Option type: 'call' or 'put'")
+        .def_readwrite("dtype", &PricingConfig::dtype, "Path simulation precision for parallel pricing: 'float64' or 'float32'")
+        .def("clone", [](const PricingConfig &c) { return c; },
+             "Return an independent copy of this config")
+        .def("__copy__", [](const PricingConfig &c) { return c; })
+        .def("__deepcopy__", [](const PricingConfig &c, py::dict) { return c; }, py::arg("memo"))
         .def("__repr__", [](const PricingConfig &c) {
             return "PricingConfig(S0=" + std::to_string(c.S0) + 
                    ", K=" + std::to_string(c.K) +
@@ -257,7 +491,8 @@ PYBIND11_MODULE(montecarlo_pricer, m)
                    ", sigma=" + std::to_string(c.sigma) +
                    ", T=" + std::to_string(c.T) +
                    ", n_paths=" + std::to_string(c.n_paths) +
-                   ", option_type='" + c.option_type + "')";
+                   ", option_type='" + c.option_type + "'" +
+                   ", dtype='" + c.dtype + "')";
         });
 
     // PricingResult class
@@ -296,17 +531,53 @@ PYBIND11_MODULE(montecarlo_pricer, m)
                    ", rho=" + std::to_string(g.rho) + ")";
         });
 
-    // MonteCarloPricerPy class
+    // MonteCarloPricerPy class. Pricing methods release the GIL while the kernel
+    // runs so other Python threads can make progress; calls on the same pricer
+    // instance are serialised by its mutex (it owns one RNG).
     py::class_<MonteCarloPricerPy>(m, "MonteCarloPricer")
         .def(py::init<uint64_t>(), py::arg("seed") = 0,
              "Initialize Monte Carlo pricer with optional seed")
+        .def("reset_seed", &MonteCarloPricerPy::reset_seed, py::arg("seed") = 0,
+             py::call_guard<py::gil_scoped_release>(),
+             "Reseed the pricer's random stream (0=random); parallel thread seeds are drawn from it")
         .def("price_mc", &MonteCarloPricerPy::price_mc, py::arg("config"),
+             py::call_guard<py::gil_scoped_release>(),
              "Price option using single-threaded Monte Carlo")
         .def("price_mc_parallel", &MonteCarloPricerPy::price_mc_parallel, py::arg("config"),
+             py::call_guard<py::gil_scoped_release>(),
              "Price option using multi-threaded Monte Carlo")
+        .def("price_mc_parallel_preallocated", &MonteCarloPricerPy::price_mc_parallel_preallocated,
+             py::arg("config"), py::arg("buf").noconvert(),
+             "Multi-threaded Monte Carlo writing terminal prices into a caller-owned float32 buffer (len >= n_paths)")
+        .def("price_mc_multi", &MonteCarloPricerPy::price_mc_multi,
+             py::arg("config"),
+             py::arg("variants") = std::vector<std::pair<bool, bool>>{
+                 {false, false}, {true, false}, {false, true}, {true, true}},
+             py::call_guard<py::gil_scoped_release>(),
+             "Price a list of (use_antithetic, use_control_variate) variants from one multi-threaded path sweep; "
+             "returns one PricingResult per variant")
+        .def("price_mc_parallel_both", &MonteCarloPricerPy::price_mc_parallel_both, py::arg("config"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Price the call and put with strike K from one multi-threaded path sweep; "
+             "returns (call_result, put_result). config.option_type is ignored")
+        .def("price_mc_parallel_checkpoints", &MonteCarloPricerPy::price_mc_parallel_checkpoints,
+             py::arg("config"),
+             py::arg("checkpoints") = std::vector<std::size_t>{
+                 10000, 50000, 100000, 500000, 1000000, 5000000, 10000000},
+             py::call_guard<py::gil_scoped_release>(),
+             "Price at every path count in checkpoints (strictly increasing) from one multi-threaded run "
+             "of max(checkpoints) paths; returns one PricingResult per checkpoint. config.n_paths is ignored")
         .def("compute_greeks", &MonteCarloPricerPy::compute_greeks, 
              py::arg("config"), py::arg("use_parallel") = true,
+             py::call_guard<py::gil_scoped_release>(),
              "Compute Greeks using finite differences")
+        .def("compute_greeks_crn", &MonteCarloPricerPy::compute_greeks_crn, py::arg("config"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Compute Greeks using finite differences priced in one multi-threaded sweep on common random numbers")
+        .def("compute_greeks_pathwise", &MonteCarloPricerPy::compute_greeks_pathwise, py::arg("config"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Compute Greeks from one multi-threaded sweep with pathwise (delta, vega, theta, rho) "
+             "and likelihood-ratio (gamma) estimators")
         .def("analytical_price", &MonteCarloPricerPy::analytical_price, py::arg("config"),
              "Get Black-Scholes analytical price for comparison");
 
@@ -4,10 +4,34 @@
 #include "rng.hpp"
 #include "payoff.hpp"
 #include <cstddef>
+#include <functional>
 #include <vector>
 
 namespace montecarlo
 {
+    // Floating-point type used to simulate terminal prices in the parallel kernel
+    enum class Precision
+    {
+        Float64,
+        Float32
+    };
+
+    // One estimator configuration priced by price_by_mc_parallel_multi
+    struct EstimatorVariant
+    {
+        bool use_antithetic{true};
+        bool use_control_variate{false};
+    };
+
+    // Market parameters for one leg of a common-random-numbers sweep
+    struct MarketScenario
+    {
+        double S0{100.0};
+        double r{0.05};
+        double sigma{0.2};
+        double T{1.0};
+    };
+
     struct PricingResult
     {
         double price{0.0};
@@ -44,6 +68,11 @@ namespace montecarlo
                                   const Payoff *control_payoff = nullptr,
                                   double control_payoff_analytical = 0.0);
 
+        // terminal_out: optional caller-owned buffer (>= n_paths floats) that
+        // receives every simulated terminal price S_T, so repeated calls can
+        // reuse one allocation instead of each owning its own. Without it nothing
+        // is stored per path: every worker simulates in 64-path batches through
+        // fixed-size scratch vectors, so a call's memory does not grow with n_paths.
         PricingResult price_by_mc_parallel(const Payoff &payoff,
                                            double S0,
                                            double r,
@@ -55,7 +84,78 @@ namespace montecarlo
                                            bool use_control_variate = false,
                                            const Payoff *control_payoff = nullptr,
                                            double control_payoff_analytical = 0.0,
-                                           std::size_t n_threads = 0);
+                                           std::size_t n_threads = 0,
+                                           float *terminal_out = nullptr,
+                                           Precision precision = Precision::Float64);
+
+        // Prices every variant from a single set of simulated paths: each draw
+        // feeds the standard estimator and (with its mirror) the antithetic one,
+        // while control variate sums are shared by the with/without-CV variants.
+        std::vector<PricingResult> price_by_mc_parallel_multi(const Payoff &payoff,
+                                                              double S0,
+                                                              double r,
+                                                              double sigma,
+                                                              double T,
+                                                              std::size_t n_paths,
+                                                              const std::vector<EstimatorVariant> &variants,
+                                                              double confidence_level = 0.95,
+                                                              const Payoff *control_payoff = nullptr,
+                                                              double control_payoff_analytical = 0.0,
+                                                              std::size_t n_threads = 0,
+                                                              Precision precision = Precision::Float64);
+
+        // Prices the payoff under every scenario using common random numbers:
+        // each normal draw Z drives the terminal price of all scenarios, so
+        // differences between scenario prices (e.g. bump-and-reprice Greeks)
+        // carry far less Monte Carlo noise than independent runs.
+        std::vector<PricingResult> price_by_mc_parallel_crn(const Payoff &payoff,
+                                                            const std::vector<MarketScenario> &scenarios,
+                                                            std::size_t n_paths,
+                                                            double confidence_level = 0.95,
+                                                            bool use_antithetic = true,
+                                                            std::size_t n_threads = 0);
+
+        // Prices several payoffs on the same simulated terminal prices (one
+        // set of paths, one payoff evaluation per path per payoff).
+        std::vector<PricingResult> price_by_mc_parallel_payoffs(const std::vector<const Payoff *> &payoffs,
+                                                                double S0,
+                                                                double r,
+                                                                double sigma,
+                                                                double T,
+                                                                std::size_t n_paths,
+                                                                double confidence_level = 0.95,
+                                                                bool use_antithetic = true,
+                                                                std::size_t n_threads = 0);
+
+        // Price and Greeks from one set of paths: Delta, Vega, Theta and Rho by
+        // pathwise differentiation of the payoff along each path, Gamma by the
+        // mixed pathwise/likelihood-ratio estimator (the payoff derivative is a
+        // step, so it cannot be differentiated again). Results are, in order:
+        // price, delta, gamma, vega, theta (dV/dT), rho. Requires sigma, T > 0.
+        std::vector<PricingResult> price_by_mc_parallel_pathwise(const Payoff &payoff,
+                                                                 double S0,
+                                                                 double r,
+                                                                 double sigma,
+                                                                 double T,
+                                                                 std::size_t n_paths,
+                                                                 double confidence_level = 0.95,
+                                                                 bool use_antithetic = true,
+                                                                 std::size_t n_threads = 0);
+
+        // Convergence sweep from one run: result k is the estimate after the first
+        // checkpoints[k] paths (checkpoints strictly increasing; the last one is
+        // the total path count). Each thread's paths for a smaller checkpoint are
+        // a prefix of its paths for the larger ones. No control variate.
+        std::vector<PricingResult> price_by_mc_parallel_checkpoints(const Payoff &payoff,
+                                                                    double S0,
+                                                                    double r,
+                                                                    double sigma,
+                                                                    double T,
+                                                                    const std::vector<std::size_t> &checkpoints,
+                                                                    double confidence_level = 0.95,
+                                                                    bool use_antithetic = true,
+                                                                    std::size_t n_threads = 0,
+                                                                    Precision precision = Precision::Float64);
 
     private:
         RNG &rng_;
@@ -71,7 +171,15 @@ namespace montecarlo
             std::size_t effective_samples{0};
         };
 
-        // Helper function for thread worker
+        // Per-thread sums for the standard and antithetic estimators
+        struct VariantWorkerResult
+        {
+            ThreadWorkerResult standard;
+            ThreadWorkerResult antithetic;
+        };
+
+        // Helper function for thread worker (Real = path simulation precision)
+        template <typename Real>
         ThreadWorkerResult thread_worker(const Payoff &payoff,
                                         double S0,
                                         double r,
@@ -81,7 +189,70 @@ namespace montecarlo
                                         bool use_antithetic,
                                         bool use_control_variate,
                                         const Payoff *control_payoff,
-                                        uint64_t thread_seed);
+                                        RNG &thread_rng,
+                                        float *terminal_out);
+
+        template <typename Real>
+        VariantWorkerResult variant_thread_worker(const Payoff &payoff,
+                                                  double S0,
+                                                  double r,
+                                                  double sigma,
+                                                  double T,
+                                                  std::size_t n_paths,
+                                                  const Payoff *control_payoff,
+                                                  uint64_t thread_seed);
+
+        // Per-thread worker for run_parallel_legs:
+        // (thread index, thread count, thread_seed) -> sums for every leg
+        using LegWorker = std::function<std::vector<ThreadWorkerResult>(std::size_t, std::size_t, uint64_t)>;
+
+        // Runs worker on every thread and finalizes each leg's reduced sums
+        // into a PricingResult (no control variate, samples = n_paths)
+        std::vector<PricingResult> run_parallel_legs(std::size_t n_legs,
+                                                     std::size_t n_paths,
+                                                     double confidence_level,
+                                                     std::size_t n_threads,
+                                                     const LegWorker &worker);
+
+        // Common-random-numbers sweep over every (scenario, payoff) leg;
+        // results are indexed [scenario * payoffs.size() + payoff]
+        std::vector<PricingResult> run_crn(const std::vector<const Payoff *> &payoffs,
+                                           const std::vector<MarketScenario> &scenarios,
+                                           std::size_t n_paths,
+                                           double confidence_level,
+                                           bool use_antithetic,
+                                           std::size_t n_threads);
+
+        std::vector<ThreadWorkerResult> crn_thread_worker(const std::vector<const Payoff *> &payoffs,
+                                                          const std::vector<MarketScenario> &scenarios,
+                                                          std::size_t n_paths,
+                                                          bool use_antithetic,
+                                                          uint64_t thread_seed);
+
+        std::vector<ThreadWorkerResult> pathwise_thread_worker(const Payoff &payoff,
+                                                               double S0,
+                                                               double r,
+                                                               double sigma,
+                                                               double T,
+                                                               std::size_t n_paths,
+                                                               bool use_antithetic,
+                                                               uint64_t thread_seed);
+
+        // Paths of n_paths assigned to thread i of n_threads
+        static std::size_t thread_share(std::size_t n_paths, std::size_t n_threads, std::size_t i);
+
+        static std::size_t resolve_thread_count(std::size_t n_threads);
+
+        std::vector<uint64_t> make_thread_seeds(std::size_t n_threads);
+
+        static ThreadWorkerResult reduce_thread_results(const std::vector<ThreadWorkerResult> &thread_results);
+
+        // Turns reduced sums into price, std error, CI and control variate diagnostics
+        static PricingResult finalize_result(const ThreadWorkerResult &totals,
+                                             std::size_t n_paths,
+                                             double confidence_level,
+                                             bool use_control_variate,
+                                             double control_payoff_analytical);
     };
 }
 
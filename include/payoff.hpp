@@ -7,6 +7,8 @@ namespace montecarlo{
     class Payoff{
         public:
         virtual double operator()(double spot) const = 0;
+        // d(payoff)/d(spot), used by the pathwise Greeks estimators
+        virtual double derivative(double spot) const = 0;
         virtual ~Payoff() = default;
     };
 
@@ -14,6 +16,7 @@ namespace montecarlo{
     public:
         explicit EuropeanCall(double strike);
         double operator()(double spot) const override;
+        double derivative(double spot) const override;
     private:
         double strike_;
     };
@@ -22,6 +25,7 @@ namespace montecarlo{
     public:
         explicit EuropeanPut(double strike);
         double operator()(double spot) const override;
+        double derivative(double spot) const override;
     private:
         double strike_;
     };
@@ -16,17 +16,24 @@ namespace montecarlo
 
         double uniform();
 
+        // Raw 64-bit engine output, e.g. for deriving per-thread seeds
+        uint64_t next_u64();
+
         double normal();
 
         std::vector<double> normal_vector(std::size_t n);
 
-        // Batch generation for SIMD-friendly processing
+        // Batch generation for SIMD-friendly processing. The float overload
+        // draws from its own single-precision distribution, so float kernels
+        // don't pay for double-precision normals they then round away
         void normal_batch(double* out, std::size_t n);
+        void normal_batch(float* out, std::size_t n);
 
     private:
         std::mt19937_64 engine_;
         std::uniform_real_distribution<double> uniform_dist_;
         std::normal_distribution<double> normal_dist_;
+        std::normal_distribution<float> normal_dist_float_;
     };
 }
 
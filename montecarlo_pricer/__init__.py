@@ -0,0 +1,45 @@
+"""
+Monte Carlo option pricer with multi-threading and SIMD optimization
+
+The compiled C++ extension (montecarlo_pricer._core) is used when it is built.
+Otherwise the Numba implementation in _numba_fallback is substituted, which
+covers the core pricing API so scripts still run where the extension cannot
+be compiled. BACKEND tells which one was loaded ("cpp" or "numba").
+"""
+
+try:
+    from ._core import (
+        Greeks,
+        MonteCarloPricer,
+        PricingConfig,
+        PricingResult,
+        black_scholes_call,
+        black_scholes_put,
+    )
+    BACKEND = "cpp"
+except ImportError as core_error:
+    try:
+        from ._numba_fallback import (
+            Greeks,
+            MonteCarloPricer,
+            PricingConfig,
+            PricingResult,
+            black_scholes_call,
+            black_scholes_put,
+        )
+    except ImportError:
+        raise ImportError(
+            "montecarlo_pricer: the C++ extension is not built and the Numba fallback "
+            "is unavailable (pip install numba)"
+        ) from core_error
+    BACKEND = "numba"
+
+__all__ = [
+    "BACKEND",
+    "Greeks",
+    "MonteCarloPricer",
+    "PricingConfig",
+    "PricingResult",
+    "black_scholes_call",
+    "black_scholes_put",
+]
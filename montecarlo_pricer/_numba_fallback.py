@@ -0,0 +1,765 @@
+"""
+Numba implementation of the core montecarlo_pricer API
+
+Used by the package when the C++ extension is not available. It mirrors the
+extension's classes and estimators (antithetic variates, control variates,
+per-thread RNG streams seeded from the pricer, same standard error and
+confidence intervals) for every MonteCarloPricer method. Paths are always
+simulated in float64, so every method raises for dtype="float32" instead of
+running float64 under a float32 label.
+
+The kernels are written as explicit scalar loops over paths inside prange
+rather than NumPy array expressions, so Numba compiles each of them to a
+single fused loop with no temporaries. Like the C++ workers they return raw
+sums; _finalize turns them into a PricingResult exactly as finalize_result
+does.
+"""
+
+import contextlib
+import math
+
+import numba
+import numpy as np
+from numba import njit, prange
+
+
+# Same z-scores as the C++ finalize step (any other level falls back to 95%)
+Z_SCORES = {0.90: 1.645, 0.95: 1.96, 0.99: 2.576}
+
+# Finite-difference bump sizes, matching the extension's compute_greeks
+SPOT_BUMP = 0.01          # 1% of S0
+VOL_BUMP = 0.01           # 1 vol point
+TIME_BUMP = -1.0 / 365.0  # -1 day
+RATE_BUMP = 0.01          # 1% rate
+
+# Defaults of the extension's price_mc_multi / price_mc_parallel_checkpoints
+DEFAULT_VARIANTS = [(False, False), (True, False), (False, True), (True, True)]
+DEFAULT_CHECKPOINTS = [10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000, 10_000_000]
+
+# Columns of the per-estimator sums returned by the kernels (the C++ ThreadWorkerResult)
+SUM, SUM_SQUARED, CONTROL_SUM, SUM_PRODUCT, CONTROL_SUM_SQUARED, COUNT = range(6)
+N_SUMS = 6
+
+# Passed as terminal_out when the caller does not want terminal prices
+_NO_TERMINALS = np.empty(0, dtype=np.float32)
+
+
+class PricingConfig:
+    """Configuration object for pricing (same attributes as the extension's)"""
+
+    def __init__(self):
+        self.S0 = 100.0
+        self.K = 100.0
+        self.r = 0.05
+        self.sigma = 0.2
+        self.T = 1.0
+        self.n_paths = 100_000
+        self.confidence_level = 0.95
+        self.use_antithetic = True
+        self.use_control_variate = False
+        self.control_option_type = "auto"
+        self.control_strike = 0.0
+        self.n_threads = 0
+        self.option_type = "call"
+        self.dtype = "float64"
+
+    def clone(self):
+        """Return an independent copy of this config"""
+        config = PricingConfig()
+        config.__dict__.update(self.__dict__)
+        return config
+
+    def __copy__(self):
+        return self.clone()
+
+    def __deepcopy__(self, memo):
+        return self.clone()
+
+    def __repr__(self):
+        return (f"PricingConfig(S0={self.S0:.6f}, K={self.K:.6f}, r={self.r:.6f}, "
+                f"sigma={self.sigma:.6f}, T={self.T:.6f}, n_paths={self.n_paths}, "
+                f"option_type='{self.option_type}', dtype='{self.dtype}')")
+
+
+class PricingResult:
+    """Result object from pricing (same attributes as the extension's)"""
+
+    def __init__(self):
+        self.price = 0.0
+        self.std_error = 0.0
+        self.samples = 0
+        self.ci_lower = 0.0
+        self.ci_upper = 0.0
+        self.confidence_level = 0.95
+        self.control_payoff_mc = 0.0
+        self.control_payoff_analytical = 0.0
+        self.control_variate_used = False
+        self.control_beta = 0.0
+        self.variance_reduction_factor = 1.0
+
+    def __repr__(self):
+        return (f"PricingResult(price={self.price:.6f}, std_error={self.std_error:.6f}, "
+                f"CI=[{self.ci_lower:.6f}, {self.ci_upper:.6f}])")
+
+
+class Greeks:
+    """Greeks calculation result"""
+
+    def __init__(self):
+        self.delta = 0.0
+        self.gamma = 0.0
+        self.vega = 0.0
+        self.theta = 0.0
+        self.rho = 0.0
+
+    def __repr__(self):
+        return (f"Greeks(delta={self.delta:.6f}, gamma={self.gamma:.6f}, vega={self.vega:.6f}, "
+                f"theta={self.theta:.6f}, rho={self.rho:.6f})")
+
+
+def _normal_cdf(x):
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+
+def black_scholes_call(S0, K, r, sigma, T):
+    """Black-Scholes analytical call price"""
+    if T <= 0.0:
+        return max(S0 - K, 0.0)
+    if sigma <= 0.0:
+        return math.exp(-r * T) * max(S0 * math.exp(r * T) - K, 0.0)
+    sqrt_T = math.sqrt(T)
+    d1 = (math.log(S0 / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    return S0 * _normal_cdf(d1) - K * math.exp(-r * T) * _normal_cdf(d2)
+
+
+def black_scholes_put(S0, K, r, sigma, T):
+    """Black-Scholes analytical put price"""
+    if T <= 0.0:
+        return max(K - S0, 0.0)
+    if sigma <= 0.0:
+        return math.exp(-r * T) * max(K - S0 * math.exp(r * T), 0.0)
+    sqrt_T = math.sqrt(T)
+    d1 = (math.log(S0 / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    return K * math.exp(-r * T) * _normal_cdf(-d2) - S0 * _normal_cdf(-d1)
+
+
+@njit(inline="always")
+def _splitmix64(state):
+    """Advance a SplitMix64 state; return (new state, 64 random bits)"""
+    state = state + np.uint64(0x9E3779B97F4A7C15)
+    z = state
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return state, z ^ (z >> np.uint64(31))
+
+
+@njit(inline="always")
+def _uniform(bits):
+    """Map 64 random bits to a double in (0, 1)"""
+    return (np.float64(bits >> np.uint64(11)) + 0.5) * (1.0 / 9007199254740992.0)
+
+
+@njit(inline="always")
+def _next_normal(state):
+    """Box-Muller standard normal from two SplitMix64 draws; return (new state, Z)"""
+    state, bits1 = _splitmix64(state)
+    state, bits2 = _splitmix64(state)
+    radius = math.sqrt(-2.0 * math.log(_uniform(bits1)))
+    return state, radius * math.cos(2.0 * math.pi * _uniform(bits2))
+
+
+@njit(inline="always")
+def _payoff(ST, K, is_call):
+    return max(ST - K, 0.0) if is_call else max(K - ST, 0.0)
+
+
+@njit(inline="always")
+def _thread_share(n_paths, n_chunks, c):
+    """Paths of n_paths assigned to chunk c of n_chunks (the C++ thread_share)"""
+    return n_paths // n_chunks + (1 if c < n_paths % n_chunks else 0)
+
+
+@njit(inline="always")
+def _chunk_offset(n_paths, n_chunks, c):
+    """Index of chunk c's first path when chunks take consecutive shares"""
+    # prange indices are unsigned, and uint64 mixed with int64 promotes to float64
+    i = np.int64(c)
+    return i * (n_paths // n_chunks) + min(i, n_paths % n_chunks)
+
+
+@njit(cache=True)
+def _reduce_chunks(chunk_sums):
+    """Add up the per-chunk sums of shape (chunks, estimators, N_SUMS)"""
+    totals = np.zeros((chunk_sums.shape[1], N_SUMS))
+    for c in range(chunk_sums.shape[0]):
+        for k in range(chunk_sums.shape[1]):
+            for j in range(N_SUMS):
+                totals[k, j] += chunk_sums[c, k, j]
+    return totals
+
+
+@njit(inline="always")
+def _simulate_segment(state, n_paths, S0, drift, diffusion, discount, K, is_call, use_antithetic,
+                      use_control_variate, control_K, control_is_call, terminal_out, offset):
+    """Sums over n_paths paths on one RNG stream; return (new state, sums...).
+
+    With antithetic variates a sample is the average of a (Z, -Z) pair, and an
+    odd trailing path counts as one more sample. Pair k's terminal prices go to
+    terminal_out[offset + 2k] and [offset + 2k + 1], the odd path after them.
+    """
+    write_terminals = terminal_out.shape[0] > 0
+    total = 0.0
+    total_squared = 0.0
+    control_total = 0.0
+    product = 0.0
+    control_squared = 0.0
+
+    pairs = n_paths // 2 if use_antithetic else 0
+    for i in range(pairs):
+        state, Z = _next_normal(state)
+        ST_up = S0 * math.exp(drift + diffusion * Z)
+        ST_down = S0 * math.exp(drift - diffusion * Z)
+        if write_terminals:
+            terminal_out[offset + 2 * i] = ST_up
+            terminal_out[offset + 2 * i + 1] = ST_down
+        value = discount * 0.5 * (_payoff(ST_up, K, is_call) + _payoff(ST_down, K, is_call))
+        total += value
+        total_squared += value * value
+        if use_control_variate:
+            control = discount * 0.5 * (_payoff(ST_up, control_K, control_is_call)
+                                        + _payoff(ST_down, control_K, control_is_call))
+            control_total += control
+            product += value * control
+            control_squared += control * control
+
+    for i in range(2 * pairs, n_paths):
+        state, Z = _next_normal(state)
+        ST = S0 * math.exp(drift + diffusion * Z)
+        if write_terminals:
+            terminal_out[offset + i] = ST
+        value = discount * _payoff(ST, K, is_call)
+        total += value
+        total_squared += value * value
+        if use_control_variate:
+            control = discount * _payoff(ST, control_K, control_is_call)
+            control_total += control
+            product += value * control
+            control_squared += control * control
+
+    count = pairs + (n_paths - 2 * pairs)
+    return state, total, total_squared, control_total, product, control_squared, count
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _price_mc(S0, K, r, sigma, T, is_call, use_antithetic, use_control_variate, control_K,
+              control_is_call, checkpoints, seeds, terminal_out):
+    """Sums after each checkpoint, shape (len(checkpoints), N_SUMS).
+
+    Paths are split into one contiguous share per entry of seeds, each run on
+    its own RNG stream (like the C++ per-thread workers). A chunk's share of
+    each checkpoint is simulated as one more segment on the same stream, so
+    its paths for a smaller checkpoint are a prefix of those for the larger
+    ones. Pass a single checkpoint of n_paths for a plain run.
+    """
+    n_chunks = seeds.shape[0]
+    n_checkpoints = checkpoints.shape[0]
+    n_paths = checkpoints[n_checkpoints - 1]
+    discount = math.exp(-r * T)
+    drift = (r - 0.5 * sigma * sigma) * T
+    diffusion = sigma * math.sqrt(T)
+
+    chunk_sums = np.zeros((n_chunks, n_checkpoints, N_SUMS))
+    for c in prange(n_chunks):
+        state = seeds[c]
+        offset = _chunk_offset(n_paths, n_chunks, c)
+        running = np.zeros(N_SUMS)
+        done = 0
+        for k in range(n_checkpoints):
+            share = _thread_share(checkpoints[k], n_chunks, c)
+            state, total, total_squared, control_total, product, control_squared, count = _simulate_segment(
+                state, share - done, S0, drift, diffusion, discount, K, is_call, use_antithetic,
+                use_control_variate, control_K, control_is_call, terminal_out, offset + done
+            )
+            running[SUM] += total
+            running[SUM_SQUARED] += total_squared
+            running[CONTROL_SUM] += control_total
+            running[SUM_PRODUCT] += product
+            running[CONTROL_SUM_SQUARED] += control_squared
+            running[COUNT] += count
+            chunk_sums[c, k, :] = running
+            done = share
+
+    return _reduce_chunks(chunk_sums)
+
+
+@njit(inline="always")
+def _accumulate(sums, value, control):
+    sums[SUM] += value
+    sums[SUM_SQUARED] += value * value
+    sums[CONTROL_SUM] += control
+    sums[SUM_PRODUCT] += value * control
+    sums[CONTROL_SUM_SQUARED] += control * control
+    sums[COUNT] += 1.0
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _price_mc_variants(S0, K, r, sigma, T, is_call, n_paths, use_control_variate, control_K,
+                       control_is_call, seeds):
+    """Standard and antithetic sums from one set of paths, shape (2, N_SUMS).
+
+    Row 0 uses every draw. Row 1 pairs draw 2k of each chunk with its mirror
+    and keeps a trailing odd draw as a single sample, as the C++
+    variant_thread_worker does.
+    """
+    n_chunks = seeds.shape[0]
+    discount = math.exp(-r * T)
+    drift = (r - 0.5 * sigma * sigma) * T
+    diffusion = sigma * math.sqrt(T)
+    # S_T(-Z) = S0^2 * exp(2 * drift) / S_T(Z), so the mirror costs a division, not an exp()
+    mirror_scale = S0 * S0 * math.exp(2.0 * drift)
+
+    chunk_sums = np.zeros((n_chunks, 2, N_SUMS))
+    for c in prange(n_chunks):
+        n = _thread_share(n_paths, n_chunks, c)
+        state = seeds[c]
+        standard = chunk_sums[c, 0]
+        antithetic = chunk_sums[c, 1]
+        for j in range(n):
+            state, Z = _next_normal(state)
+            ST = S0 * math.exp(drift + diffusion * Z)
+            value = discount * _payoff(ST, K, is_call)
+            control = discount * _payoff(ST, control_K, control_is_call) if use_control_variate else 0.0
+            _accumulate(standard, value, control)
+
+            if j % 2 != 0:
+                continue
+            if j + 1 < n:
+                ST_mirror = mirror_scale / ST
+                value = 0.5 * (value + discount * _payoff(ST_mirror, K, is_call))
+                if use_control_variate:
+                    control = 0.5 * (control + discount * _payoff(ST_mirror, control_K, control_is_call))
+            _accumulate(antithetic, value, control)
+
+    return _reduce_chunks(chunk_sums)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _price_mc_scenarios(scenarios, strikes, calls, n_paths, use_antithetic, seeds):
+    """Common-random-numbers sums for every (scenario, payoff) leg.
+
+    scenarios rows are (S0, r, sigma, T); payoff p has strike strikes[p] and is
+    a call if calls[p]. Every normal draw drives the terminal price of all
+    scenarios. Rows of the result are indexed scenario * len(strikes) + payoff.
+    """
+    n_chunks = seeds.shape[0]
+    n_scenarios = scenarios.shape[0]
+    n_payoffs = strikes.shape[0]
+
+    discount = np.empty(n_scenarios)
+    drift = np.empty(n_scenarios)
+    diffusion = np.empty(n_scenarios)
+    for s in range(n_scenarios):
+        r = scenarios[s, 1]
+        sigma = scenarios[s, 2]
+        T = scenarios[s, 3]
+        discount[s] = math.exp(-r * T)
+        drift[s] = (r - 0.5 * sigma * sigma) * T
+        diffusion[s] = sigma * math.sqrt(T)
+
+    chunk_sums = np.zeros((n_chunks, n_scenarios * n_payoffs, N_SUMS))
+    for c in prange(n_chunks):
+        n = _thread_share(n_paths, n_chunks, c)
+        state = seeds[c]
+        sums = chunk_sums[c]
+        pairs = n // 2 if use_antithetic else 0
+        draws = pairs + (n - 2 * pairs)
+        for i in range(draws):
+            state, Z = _next_normal(state)
+            antithetic = i < pairs
+            for s in range(n_scenarios):
+                ST = scenarios[s, 0] * math.exp(drift[s] + diffusion[s] * Z)
+                ST_mirror = scenarios[s, 0] * math.exp(drift[s] - diffusion[s] * Z) if antithetic else ST
+                for p in range(n_payoffs):
+                    value = discount[s] * _payoff(ST, strikes[p], calls[p])
+                    if antithetic:
+                        value = 0.5 * (value + discount[s] * _payoff(ST_mirror, strikes[p], calls[p]))
+                    _accumulate(sums[s * n_payoffs + p], value, 0.0)
+
+    return _reduce_chunks(chunk_sums)
+
+
+@njit(inline="always")
+def _payoff_derivative(ST, K, is_call):
+    if is_call:
+        return 1.0 if ST > K else 0.0
+    return -1.0 if ST < K else 0.0
+
+
+@njit(inline="always")
+def _pathwise_estimates(Z, S0, K, r, sigma, T, is_call, estimates):
+    """Discounted per-path price, delta, gamma, vega, theta (dV/dT) and rho for draw Z.
+
+    dS_T/dS0 = S_T/S0, dS_T/dsigma = S_T (sqrt(T) Z - sigma T) and
+    dS_T/dT = S_T (r - sigma^2/2 + sigma Z / (2 sqrt(T))); gamma uses the
+    likelihood-ratio weight Z / (sigma sqrt(T)) - 1.
+    """
+    sqrt_T = math.sqrt(T)
+    discount = math.exp(-r * T)
+    diffusion = sigma * sqrt_T
+    ST = S0 * math.exp((r - 0.5 * sigma * sigma) * T + diffusion * Z)
+    value = _payoff(ST, K, is_call)
+    slope = _payoff_derivative(ST, K, is_call) * ST
+
+    estimates[0] = discount * value
+    estimates[1] = discount * slope / S0
+    estimates[2] = discount * slope / (S0 * S0) * (Z / diffusion - 1.0)
+    estimates[3] = discount * slope * (sqrt_T * Z - sigma * T)
+    estimates[4] = discount * (slope * (r - 0.5 * sigma * sigma + sigma * Z / (2.0 * sqrt_T)) - r * value)
+    estimates[5] = discount * T * (slope - value)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _price_mc_pathwise(S0, K, r, sigma, T, is_call, n_paths, use_antithetic, seeds):
+    """Sums of the six pathwise estimates of _pathwise_estimates, shape (6, N_SUMS).
+
+    With antithetic variates each (Z, -Z) pair is averaged into one sample and
+    a trailing odd path is a single sample, as in the C++ pathwise_thread_worker.
+    """
+    n_chunks = seeds.shape[0]
+    chunk_sums = np.zeros((n_chunks, 6, N_SUMS))
+    for c in prange(n_chunks):
+        n = _thread_share(n_paths, n_chunks, c)
+        state = seeds[c]
+        sums = chunk_sums[c]
+        estimates = np.empty(6)
+        mirror = np.empty(6)
+        pairs = n // 2 if use_antithetic else 0
+        draws = pairs + (n - 2 * pairs)
+        for i in range(draws):
+            state, Z = _next_normal(state)
+            _pathwise_estimates(Z, S0, K, r, sigma, T, is_call, estimates)
+            if i < pairs:
+                _pathwise_estimates(-Z, S0, K, r, sigma, T, is_call, mirror)
+                for k in range(6):
+                    estimates[k] = 0.5 * (estimates[k] + mirror[k])
+            for k in range(6):
+                _accumulate(sums[k], estimates[k], 0.0)
+
+    return _reduce_chunks(chunk_sums)
+
+
+def _finalize(sums, n_paths, confidence_level, use_control_variate=False, control_analytical=0.0):
+    """Turn one estimator's reduced sums into a PricingResult (the C++ finalize_result)"""
+    result = PricingResult()
+    result.samples = n_paths
+
+    samples = int(sums[COUNT])
+    mean = sums[SUM] / samples
+    variance_without_cv = 0.0
+
+    if use_control_variate:
+        # Optimal beta = Cov(payoff, control) / Var(control)
+        control_mean = sums[CONTROL_SUM] / samples
+        mean_payoff = mean
+        cov = sums[SUM_PRODUCT] / samples - mean_payoff * control_mean
+        var_control = sums[CONTROL_SUM_SQUARED] / samples - control_mean * control_mean
+        beta = cov / var_control if var_control > 1e-14 else 1.0
+        if samples > 1:
+            variance_without_cv = (sums[SUM_SQUARED] - samples * mean_payoff * mean_payoff) / (samples - 1)
+
+        mean = mean_payoff + beta * (control_analytical - control_mean)
+        result.control_payoff_mc = control_mean
+        result.control_payoff_analytical = control_analytical
+        result.control_variate_used = True
+        result.control_beta = beta
+
+    result.price = mean
+    result.confidence_level = confidence_level
+
+    if samples > 1:
+        variance = (sums[SUM_SQUARED] - samples * mean * mean) / (samples - 1)
+        if -1e-14 < variance < 0.0:
+            variance = 0.0
+        result.std_error = math.sqrt(variance / samples)
+        if result.control_variate_used and variance_without_cv > 0.0:
+            result.variance_reduction_factor = variance_without_cv / max(variance, 1e-14)
+    else:
+        result.std_error = math.inf
+
+    z = next((z for level, z in Z_SCORES.items() if abs(confidence_level - level) < 1e-12), 1.96)
+    if not 0.0 < confidence_level < 1.0:
+        result.confidence_level = 0.95
+    result.ci_lower = result.price - z * result.std_error
+    result.ci_upper = result.price + z * result.std_error
+    return result
+
+
+@contextlib.contextmanager
+def _kernel_threads(n_chunks):
+    """Run Numba kernels on up to n_chunks threads, restoring the caller's setting after"""
+    previous = numba.get_num_threads()
+    numba.set_num_threads(max(1, min(n_chunks, numba.config.NUMBA_NUM_THREADS)))
+    try:
+        yield
+    finally:
+        numba.set_num_threads(previous)
+
+
+class MonteCarloPricer:
+    """Monte Carlo pricer backed by the Numba kernels (same API as the C++ extension)"""
+
+    def __init__(self, seed=0):
+        self.reset_seed(seed)
+
+    def reset_seed(self, seed=0):
+        """Reseed the pricer's random stream (0=random); chunk seeds are drawn from it"""
+        self._rng = np.random.default_rng(seed if seed != 0 else None)
+
+    def price_mc(self, config):
+        """Price option using single-threaded Monte Carlo"""
+        return self._price(config, n_chunks=1)
+
+    def price_mc_parallel(self, config):
+        """Price option using multi-threaded Monte Carlo"""
+        return self._price(config, _chunk_count(config))
+
+    def price_mc_parallel_preallocated(self, config, buf):
+        """Multi-threaded Monte Carlo writing terminal prices into a caller-owned float32 buffer"""
+        if not (isinstance(buf, np.ndarray) and buf.dtype == np.float32 and buf.flags.c_contiguous):
+            raise TypeError("price_mc_parallel_preallocated(): buf must be a C-contiguous "
+                            "numpy.float32 array")
+        if not buf.flags.writeable:
+            raise RuntimeError("Buffer is read-only")
+        if buf.size < config.n_paths:
+            raise RuntimeError(f"Buffer too small: need {config.n_paths} elements, got {buf.size}")
+        return self._price(config, _chunk_count(config), terminal_out=buf.reshape(-1))
+
+    def price_mc_multi(self, config, variants=DEFAULT_VARIANTS):
+        """Price several (use_antithetic, use_control_variate) variants from one set of paths"""
+        K, is_call = _payoff_spec(config)
+        use_control_variate = any(cv for _, cv in variants)
+        control_K, control_is_call, control_analytical = (
+            _control_spec(config) if use_control_variate else (0.0, True, 0.0)
+        )
+        _check_precision(config)
+
+        if config.n_paths == 0 or not variants:
+            return [_empty_result(config.n_paths) for _ in variants]
+
+        seeds = self._seeds(_chunk_count(config))
+        with _kernel_threads(len(seeds)):
+            sums = _price_mc_variants(
+                float(config.S0), K, float(config.r), float(config.sigma), float(config.T), is_call,
+                int(config.n_paths), use_control_variate, control_K, control_is_call, seeds
+            )
+        return [_finalize(sums[1 if antithetic else 0], config.n_paths, config.confidence_level,
+                          cv, control_analytical)
+                for antithetic, cv in variants]
+
+    def price_mc_parallel_both(self, config):
+        """Price the call and the put with strike K from the same simulated paths"""
+        if config.use_control_variate:
+            raise RuntimeError("price_mc_parallel_both does not support control variates")
+        _check_precision(config)
+
+        scenarios = np.array([[config.S0, config.r, config.sigma, config.T]], dtype=np.float64)
+        strikes = np.array([config.K, config.K], dtype=np.float64)
+        call_result, put_result = self._price_scenarios(config, scenarios, strikes,
+                                                        np.array([True, False]))
+        return call_result, put_result
+
+    def price_mc_parallel_checkpoints(self, config, checkpoints=DEFAULT_CHECKPOINTS):
+        """Path-count convergence: one PricingResult per checkpoint, from a single sweep"""
+        if config.use_control_variate:
+            raise RuntimeError("price_mc_parallel_checkpoints does not support control variates")
+        if len(checkpoints) == 0 or checkpoints[0] == 0:
+            raise RuntimeError("checkpoints must be a non-empty list of positive path counts")
+        if any(later <= earlier for earlier, later in zip(checkpoints, checkpoints[1:])):
+            raise RuntimeError("checkpoints must be strictly increasing")
+
+        K, is_call = _payoff_spec(config)
+        _check_precision(config)
+
+        seeds = self._seeds(_chunk_count(config))
+        with _kernel_threads(len(seeds)):
+            sums = _price_mc(
+                float(config.S0), K, float(config.r), float(config.sigma), float(config.T), is_call,
+                bool(config.use_antithetic), False, 0.0, True,
+                np.asarray(checkpoints, dtype=np.int64), seeds, _NO_TERMINALS
+            )
+
+        results = []
+        for checkpoint, checkpoint_sums in zip(checkpoints, sums):
+            result = _finalize(checkpoint_sums, checkpoints[-1], config.confidence_level)
+            result.samples = checkpoint
+            results.append(result)
+        return results
+
+    def compute_greeks(self, config, use_parallel=True):
+        """Compute Greeks using finite differences"""
+        price = self.price_mc_parallel if use_parallel else self.price_mc
+
+        def bumped(**overrides):
+            bumped_config = config.clone()
+            for name, value in overrides.items():
+                setattr(bumped_config, name, value)
+            return price(bumped_config).price
+
+        greeks = Greeks()
+        base_price = price(config).price
+
+        dS = config.S0 * SPOT_BUMP
+        price_up = bumped(S0=config.S0 + dS)
+        price_down = bumped(S0=config.S0 - dS)
+        greeks.delta = (price_up - price_down) / (2.0 * dS)
+        greeks.gamma = (price_up - 2.0 * base_price + price_down) / (dS * dS)
+
+        greeks.vega = (bumped(sigma=config.sigma + VOL_BUMP) - base_price) / VOL_BUMP
+        if config.T + TIME_BUMP > 0:
+            greeks.theta = (bumped(T=config.T + TIME_BUMP) - base_price) / TIME_BUMP
+        greeks.rho = (bumped(r=config.r + RATE_BUMP) - base_price) / RATE_BUMP
+        return greeks
+
+    def compute_greeks_crn(self, config):
+        """Finite-difference Greeks with every bumped price from one common-random-numbers sweep"""
+        if config.use_control_variate:
+            raise RuntimeError("compute_greeks_crn does not support control variates")
+        _check_precision(config)
+        K, is_call = _payoff_spec(config)
+
+        dS = config.S0 * SPOT_BUMP
+        has_theta = config.T + TIME_BUMP > 0
+        scenarios = [
+            (config.S0, config.r, config.sigma, config.T),              # base
+            (config.S0 + dS, config.r, config.sigma, config.T),         # spot up
+            (config.S0 - dS, config.r, config.sigma, config.T),         # spot down
+            (config.S0, config.r, config.sigma + VOL_BUMP, config.T),   # vega
+            (config.S0, config.r + RATE_BUMP, config.sigma, config.T),  # rho
+        ]
+        if has_theta:
+            scenarios.append((config.S0, config.r, config.sigma, config.T + TIME_BUMP))
+
+        prices = [result.price for result in self._price_scenarios(
+            config, np.array(scenarios, dtype=np.float64), np.array([K]), np.array([is_call])
+        )]
+        base_price, price_up, price_down = prices[:3]
+
+        greeks = Greeks()
+        greeks.delta = (price_up - price_down) / (2.0 * dS)
+        greeks.gamma = (price_up - 2.0 * base_price + price_down) / (dS * dS)
+        greeks.vega = (prices[3] - base_price) / VOL_BUMP
+        greeks.rho = (prices[4] - base_price) / RATE_BUMP
+        if has_theta:
+            greeks.theta = (prices[5] - base_price) / TIME_BUMP
+        return greeks
+
+    def compute_greeks_pathwise(self, config):
+        """All five Greeks from one sweep: pathwise delta, vega, theta and rho, likelihood-ratio gamma"""
+        if config.use_control_variate:
+            raise RuntimeError("compute_greeks_pathwise does not support control variates")
+        if not (config.sigma > 0.0 and config.T > 0.0):
+            raise RuntimeError("compute_greeks_pathwise requires sigma > 0 and T > 0")
+        _check_precision(config)
+        K, is_call = _payoff_spec(config)
+
+        greeks = Greeks()
+        if config.n_paths == 0:
+            return greeks
+        seeds = self._seeds(_chunk_count(config))
+        with _kernel_threads(len(seeds)):
+            sums = _price_mc_pathwise(
+                float(config.S0), K, float(config.r), float(config.sigma), float(config.T), is_call,
+                int(config.n_paths), bool(config.use_antithetic), seeds
+            )
+        # Row 0 is the price estimate from the same paths
+        greeks.delta, greeks.gamma, greeks.vega, greeks.theta, greeks.rho = (
+            estimate_sums[SUM] / estimate_sums[COUNT] for estimate_sums in sums[1:]
+        )
+        return greeks
+
+    def analytical_price(self, config):
+        """Get Black-Scholes analytical price for comparison"""
+        closed_form = black_scholes_call if _payoff_spec(config)[1] else black_scholes_put
+        return closed_form(config.S0, config.K, config.r, config.sigma, config.T)
+
+    def _seeds(self, n_chunks):
+        return self._rng.integers(0, np.iinfo(np.uint64).max, size=n_chunks,
+                                  dtype=np.uint64, endpoint=True)
+
+    def _price(self, config, n_chunks, terminal_out=_NO_TERMINALS):
+        K, is_call = _payoff_spec(config)
+        control_K, control_is_call, control_analytical = (
+            _control_spec(config) if config.use_control_variate else (0.0, True, 0.0)
+        )
+        _check_precision(config)
+
+        if config.n_paths == 0:
+            return _empty_result(0)
+
+        seeds = self._seeds(n_chunks)
+        with _kernel_threads(n_chunks):
+            sums = _price_mc(
+                float(config.S0), K, float(config.r), float(config.sigma), float(config.T), is_call,
+                bool(config.use_antithetic), bool(config.use_control_variate), control_K,
+                control_is_call, np.array([config.n_paths], dtype=np.int64), seeds, terminal_out
+            )
+        return _finalize(sums[0], config.n_paths, config.confidence_level,
+                         config.use_control_variate, control_analytical)
+
+    def _price_scenarios(self, config, scenarios, strikes, calls):
+        """One PricingResult per (scenario, payoff) leg, from common random numbers"""
+        n_legs = len(scenarios) * len(strikes)
+        if config.n_paths == 0:
+            return [_empty_result(0) for _ in range(n_legs)]
+
+        seeds = self._seeds(_chunk_count(config))
+        with _kernel_threads(len(seeds)):
+            sums = _price_mc_scenarios(scenarios, strikes, calls, int(config.n_paths),
+                                       bool(config.use_antithetic), seeds)
+        return [_finalize(leg_sums, config.n_paths, config.confidence_level) for leg_sums in sums]
+
+
+def _chunk_count(config):
+    """Parallel methods split paths into n_threads chunks (0 = one per Numba thread)"""
+    return config.n_threads or numba.config.NUMBA_NUM_THREADS
+
+
+def _empty_result(n_paths):
+    result = PricingResult()
+    result.samples = n_paths
+    return result
+
+
+def _is_call(option_type):
+    if option_type == "call":
+        return True
+    if option_type == "put":
+        return False
+    raise RuntimeError(f"Unknown option type: {option_type}")
+
+
+def _payoff_spec(config):
+    """(strike, is_call) of the priced option"""
+    return float(config.K), _is_call(config.option_type)
+
+
+def _control_spec(config):
+    """(strike, is_call, analytical price) of the control variate option"""
+    control_type = config.option_type if config.control_option_type == "auto" else config.control_option_type
+    strike = config.control_strike if config.control_strike > 0.0 else config.K
+    if control_type not in ("call", "put"):
+        raise RuntimeError(f"Unknown control option type: {control_type}")
+    closed_form = black_scholes_call if control_type == "call" else black_scholes_put
+    analytical = closed_form(config.S0, strike, config.r, config.sigma, config.T)
+    return float(strike), control_type == "call", analytical
+
+
+def _check_precision(config):
+    """Validate dtype like the extension; only float64 is simulated here"""
+    if config.dtype not in ("float64", "float32"):
+        raise RuntimeError(f"Unknown dtype: {config.dtype} (expected 'float64' or 'float32')")
+    if config.dtype != "float64":
+        raise RuntimeError("dtype='float32' needs the C++ extension; "
+                           "the Numba fallback simulates in float64 only")
@@ -0,0 +1,87 @@
+"""
+Timing and formatting helpers shared by benchmark.py and performance_analysis.py
+"""
+
+import itertools
+import os
+import timeit
+
+import montecarlo_pricer as mcp
+
+
+SUFFIXES = [(1e9, 'B'), (1e6, 'M'), (1e3, 'K')]
+
+# Path-simulation precisions of the threading sweeps; the Numba fallback
+# simulates in float64 only and rejects float32
+SWEEP_DTYPES = ("float64", "float32") if mcp.BACKEND == "cpp" else ("float64",)
+
+
+def format_number(num, digits=2):
+    """Format large numbers with K/M/B suffixes"""
+    return next((f"{num/d:.{digits}f}{s}" for d, s in SUFFIXES if num >= d), str(int(num)))
+
+
+def available_cores():
+    """CPUs this process may run on (honours taskset/cgroup pinning where the OS exposes it)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 8
+
+
+def time_best_of(fn, repeat=5, autorange=False):
+    """Time fn() with timeit; return (best seconds per call, result of the last call).
+
+    With autorange=True every sample loops fn() long enough (>= 0.2s) to stay
+    well above clock granularity, which matters for very short runs.
+    """
+    result = None
+
+    def call():
+        nonlocal result
+        result = fn()
+
+    timer = timeit.Timer(call)
+    number = timer.autorange()[0] if autorange else 1
+    return min(timer.repeat(repeat=repeat, number=number)) / number, result
+
+
+def config_with(base, **overrides):
+    """Return a copy of base with the given attributes replaced (dataclasses.replace-style)"""
+    config = base.clone()
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    return config
+
+
+def config_grid(base, **axes):
+    """Copies of base for every combination of axes; return [(values, config)].
+
+    Every config is built up front so a sweep only prices ready-made objects.
+    values holds one entry per axis, in keyword order, e.g.
+    config_grid(base, dtype=["float64"], n_threads=[1, 2]) yields
+    (("float64", 1), config) and (("float64", 2), config).
+    """
+    names = list(axes)
+    return [(values, config_with(base, **dict(zip(names, values))))
+            for values in itertools.product(*axes.values())]
+
+
+def time_sweep(price, grid, warmup=True, autorange=None):
+    """Best-of timing of price(config) at every point of grid; return [(values, seconds, result)].
+
+    With warmup=True every point is run once, untimed, before any measurement,
+    so no point (single-threaded included) is timed cold. autorange is an
+    optional predicate on the config selecting the points short enough to need
+    time_best_of(autorange=True). Only raw samples are collected here; callers
+    format them afterwards.
+    """
+    if warmup:
+        for _, config in grid:
+            price(config)
+
+    samples = []
+    for values, config in grid:
+        elapsed, result = time_best_of(lambda: price(config),
+                                       autorange=autorange is not None and autorange(config))
+        samples.append((values, elapsed, result))
+    return samples
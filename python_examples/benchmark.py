@@ -2,25 +2,24 @@
 Performance benchmarking example comparing different configurations
 """
 
-import time
+import functools
 
 import montecarlo_pricer as mcp
+from bench_utils import SWEEP_DTYPES, available_cores, config_grid, time_best_of, time_sweep
+from bench_utils import format_number as _format_number
 
 
-def format_number(num):
-    """Format large numbers with K/M/B suffixes"""
-    if num >= 1e9:
-        return f"{num/1e9:.1f}B"
-    elif num >= 1e6:
-        return f"{num/1e6:.1f}M"
-    elif num >= 1e3:
-        return f"{num/1e3:.1f}K"
-    else:
-        return str(int(num))
+# One pricer shared by every benchmark; each benchmark reseeds it instead of
+# rebuilding it, so runs are reproducible and comparable across benchmarks
+SEED = 42
+pricer = mcp.MonteCarloPricer(seed=SEED)
 
-def benchmark_threads(n_paths=10_000_000):
-    """Benchmark different thread counts"""
-    pricer = mcp.MonteCarloPricer(seed=42)
+# Benchmark output keeps one decimal place on K/M/B numbers
+format_number = functools.partial(_format_number, digits=1)
+
+def benchmark_threads(n_paths=10_000_000, dtypes=SWEEP_DTYPES):
+    """Benchmark different thread counts at each path-simulation precision"""
+    pricer.reset_seed(SEED)
     
     config = mcp.PricingConfig()
     config.S0 = 100.0
@@ -36,49 +35,50 @@ def benchmark_threads(n_paths=10_000_000):
     print(f"Threading Benchmark - {format_number(n_paths)} paths")
     print("=" * 70)
     
-    # Test different thread counts
-    thread_counts = [1, 2, 4, 8, 16]
+    # Test different thread counts, never more than the cores we may use
+    max_cores = available_cores()
+    thread_counts = [t for t in [1, 2, 4, 8, 16] if t <= max_cores]
     results = []
     
-    for n_threads in thread_counts:
-        config.n_threads = n_threads
-        
-        start = time.perf_counter()
-        result = pricer.price_mc_parallel(config)
-        elapsed = time.perf_counter() - start
-        
+    sweep = config_grid(config, dtype=dtypes, n_threads=thread_counts)
+    samples = time_sweep(pricer.price_mc_parallel, sweep)
+    
+    for (dtype, n_threads), elapsed, result in samples:
         paths_per_sec = n_paths / elapsed
         ns_per_path = (elapsed * 1e9) / n_paths
         
         results.append({
+            'dtype': dtype,
             'threads': n_threads,
             'time': elapsed,
             'paths_per_sec': paths_per_sec,
             'ns_per_path': ns_per_path,
-            'price': result.price
+            'price': result.price,
+            'std_error': result.std_error
         })
         
-        print(f"Threads: {n_threads:2d}  "
+        print(f"{dtype:<8s} Threads: {n_threads:2d}  "
               f"Time: {elapsed:.3f}s  "
               f"Throughput: {format_number(paths_per_sec)} paths/sec  "
-              f"Latency: {ns_per_path:.2f} ns/path")
+              f"Latency: {ns_per_path:.2f} ns/path  "
+              f"Std Err: {result.std_error:.6f}")
     
-    # Calculate speedup
-    base_time = results[0]['time']
+    # Calculate speedup relative to single-threaded run at the same precision
+    base_times = {r['dtype']: r['time'] for r in reversed(results) if r['threads'] == 1}
     print("\n" + "=" * 70)
     print("Speedup Analysis:")
     print("=" * 70)
     for r in results:
-        speedup = base_time / r['time']
+        speedup = base_times[r['dtype']] / r['time']
         efficiency = (speedup / r['threads']) * 100
-        print(f"Threads: {r['threads']:2d}  "
+        print(f"{r['dtype']:<8s} Threads: {r['threads']:2d}  "
               f"Speedup: {speedup:.2f}x  "
               f"Efficiency: {efficiency:.1f}%")
     print()
 
 def benchmark_variance_reduction(n_paths=1_000_000):
     """Compare variance reduction techniques"""
-    pricer = mcp.MonteCarloPricer(seed=42)
+    pricer.reset_seed(SEED)
     
     config = mcp.PricingConfig()
     config.S0 = 100.0
@@ -105,34 +105,28 @@ def benchmark_variance_reduction(n_paths=1_000_000):
         ("Antithetic + Control", True, True),
     ]
     
-    for name, use_anti, use_cv in configs_to_test:
-        config.use_antithetic = use_anti
-        config.use_control_variate = use_cv
-        
-        start = time.perf_counter()
-        result = pricer.price_mc_parallel(config)
-        elapsed = time.perf_counter() - start
-        
+    # All variants are priced from one shared set of paths
+    variants = [(use_anti, use_cv) for _, use_anti, use_cv in configs_to_test]
+    elapsed, variant_results = time_best_of(lambda: pricer.price_mc_multi(config, variants))
+    
+    for (name, _, _), result in zip(configs_to_test, variant_results):
         error = abs(result.price - analytical)
-        variance_reduction = (result.std_error / results[0].std_error) if name != "Standard MC" else 1.0
-        
         print(f"{name:25s}  "
               f"Price: {result.price:.6f}  "
               f"Error: {error:.6f}  "
-              f"Std Err: {result.std_error:.6f}  "
-              f"Time: {elapsed:.3f}s")
+              f"Std Err: {result.std_error:.6f}")
         
         if name == "Standard MC":
             base_std_error = result.std_error
-            results = [result]
         else:
             vr_factor = base_std_error / result.std_error
             print(f"{'':25s}  Variance Reduction: {vr_factor:.2f}x")
+    print(f"\nTime (all {len(variants)} variants, one path sweep): {elapsed:.3f}s")
     print()
 
 def benchmark_path_counts():
     """Compare accuracy vs speed for different path counts"""
-    pricer = mcp.MonteCarloPricer(seed=42)
+    pricer.reset_seed(SEED)
     
     config = mcp.PricingConfig()
     config.S0 = 100.0
@@ -153,13 +147,11 @@ def benchmark_path_counts():
     
     path_counts = [10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000, 10_000_000]
     
-    for n_paths in path_counts:
-        config.n_paths = n_paths
-        
-        start = time.perf_counter()
-        result = pricer.price_mc_parallel(config)
-        elapsed = time.perf_counter() - start
-        
+    sweep = config_grid(config, n_paths=path_counts)
+    samples = time_sweep(pricer.price_mc_parallel, sweep, warmup=False,
+                         autorange=lambda cfg: cfg.n_paths < 100_000)
+    
+    for (n_paths,), elapsed, result in samples:
         error = abs(result.price - analytical)
         error_pct = (error / analytical) * 100
         
@@ -51,8 +51,8 @@ def main():
     print()
     
     # Compute Greeks
-    print("Computing Greeks (using parallel pricing)...")
-    greeks = pricer.compute_greeks(config, use_parallel=True)
+    print("Computing Greeks (pathwise estimators, one parallel sweep)...")
+    greeks = pricer.compute_greeks_pathwise(config)
     print(f"  Delta: {greeks.delta:.6f}  (sensitivity to stock price)")
     print(f"  Gamma: {greeks.gamma:.6f}  (rate of change of Delta)")
     print(f"  Vega:  {greeks.vega:.6f}  (sensitivity to volatility)")
@@ -3,23 +3,57 @@ Comprehensive performance analysis for Monte Carlo Pricer
 Generates detailed reports and visualizations
 """
 
+import functools
+import math
 import sys
-import time
 from collections import defaultdict
 
+import numpy as np
+
 import montecarlo_pricer as mcp
+from bench_utils import SWEEP_DTYPES, available_cores, config_grid, config_with, format_number, time_best_of, time_sweep
+
+
+# Column layout of the threading results record array (one row per sweep point)
+THREADING_DTYPE = [
+    ('precision', 'U8'),
+    ('threads', 'i4'),
+    ('time', 'f8'),
+    ('throughput', 'f8'),
+    ('latency_ns', 'f8'),
+    ('speedup', 'f8'),
+    ('efficiency', 'f8'),
+    ('price', 'f8'),
+    ('std_error', 'f8'),
+]
+
+# Fixed-width row layouts of the buffered analysis tables, built once at import
+THREADING_ROW_FMT = "{:<10} {:<8} {:<10.3f} {:<15} {:<15.2f} {:<10.2f} {:<12.1f} {:<12.6f} {:<12.6f}"
+CONVERGENCE_ROW_FMT = "{:<12} {:<12.6f} {:<12.6f} {:<10.4f} {:<12.6f}"
+VARIANCE_ROW_FMT = "{:<28} {:<12.6f} {:<12.6f} {:<12.6f} {:<10.2f}"
+GREEKS_SPREAD_ROW_FMT = "{:<28} {:<10.3f} {:<11.6f} {:<11.6f} {:<11.6f} {:<11.6f} {:<11.6f}"
+
+# Greeks attributes in table column order
+GREEK_NAMES = ('delta', 'gamma', 'vega', 'theta', 'rho')
+
 
+@functools.lru_cache(maxsize=32)
+def _cached_bs(S0, K, r, sigma, T, opt):
+    """Black-Scholes price for (S0, K, r, sigma, T, "call"/"put"), memoized across analyses"""
+    closed_form = mcp.black_scholes_call if opt == "call" else mcp.black_scholes_put
+    return closed_form(S0, K, r, sigma, T)
 
-def format_number(num):
-    """Format large numbers with K/M/B suffixes"""
-    if num >= 1e9:
-        return f"{num/1e9:.2f}B"
-    elif num >= 1e6:
-        return f"{num/1e6:.2f}M"
-    elif num >= 1e3:
-        return f"{num/1e3:.2f}K"
-    else:
-        return str(int(num))
+
+@functools.lru_cache(maxsize=32)
+def _discount(r, T):
+    """Discount factor exp(-rT), memoized across analyses"""
+    return math.exp(-r * T)
+
+
+def _write_rows(rows):
+    """Write buffered table rows to stdout in one call and flush once"""
+    sys.stdout.write("\n".join(rows) + "\n")
+    sys.stdout.flush()
 
 
 class PerformanceAnalyzer:
@@ -28,9 +62,15 @@ class PerformanceAnalyzer:
     def __init__(self, seed=42):
         self.pricer = mcp.MonteCarloPricer(seed=seed)
         self.results = defaultdict(list)
-        
-    def analyze_threading_scalability(self, n_paths=10_000_000, max_threads=None):
-        """Analyze performance scaling with thread count"""
+    
+    @staticmethod
+    def analytical_price(config):
+        """Closed-form price for config, served from the _cached_bs memo"""
+        return _cached_bs(config.S0, config.K, config.r, config.sigma, config.T, config.option_type)
+        
+    def analyze_threading_scalability(self, n_paths=10_000_000, max_threads=None,
+                                      dtypes=SWEEP_DTYPES):
+        """Analyze performance scaling with thread count at each path-simulation precision"""
         print("\n" + "=" * 80)
         print("THREADING SCALABILITY ANALYSIS")
         print("=" * 80)
@@ -48,8 +88,7 @@ class PerformanceAnalyzer:
         config.use_antithetic = True
         
         # Detect available cores
-        import os
-        max_cores = os.cpu_count() or 8
+        max_cores = available_cores()
         if max_threads is None:
             thread_counts = [1, 2, 4, 8]
             if max_cores >= 16:
@@ -60,54 +99,49 @@ class PerformanceAnalyzer:
             thread_counts = [2**i for i in range(int(max_threads).bit_length()) if 2**i <= max_threads]
             if max_threads not in thread_counts:
                 thread_counts.append(max_threads)
-            thread_counts = sorted([1] + thread_counts)
+            thread_counts = sorted({1, *thread_counts})
         
-        print(f"{'Threads':<8} {'Time (s)':<10} {'Throughput':<15} {'Latency':<15} {'Speedup':<10} {'Efficiency':<12} {'Price':<12}")
-        print("-" * 80)
+        # Oversubscribing the cores we may use would only measure contention
+        thread_counts = [t for t in thread_counts if t <= max_cores]
         
-        base_time = None
-        for n_threads in thread_counts:
-            config.n_threads = n_threads
-            
-            # Warm-up run
-            if n_threads == 1:
-                _ = self.pricer.price_mc_parallel(config)
-            
-            # Actual benchmark
-            start = time.perf_counter()
-            result = self.pricer.price_mc_parallel(config)
-            elapsed = time.perf_counter() - start
+        print(f"{'Precision':<10} {'Threads':<8} {'Time (s)':<10} {'Throughput':<15} {'Latency':<15} "
+              f"{'Speedup':<10} {'Efficiency':<12} {'Price':<12} {'Std Err':<12}")
+        print("-" * 104)
+        
+        sweep = config_grid(config, dtype=dtypes, n_threads=thread_counts)
+        samples = time_sweep(self.pricer.price_mc_parallel, sweep)
+        
+        # Speedup is relative to the first (single-threaded) run at the same precision
+        threading = np.recarray(shape=(len(samples),), dtype=THREADING_DTYPE)
+        base_times = {}
+        rows = []
+        for i, ((dtype, n_threads), elapsed, result) in enumerate(samples):
+            base_time = base_times.setdefault(dtype, elapsed)
             
-            if base_time is None:
-                base_time = elapsed
-                
             throughput = n_paths / elapsed
             latency_ns = (elapsed * 1e9) / n_paths
             speedup = base_time / elapsed
             efficiency = (speedup / n_threads) * 100
             
-            self.results['threading'].append({
-                'threads': n_threads,
-                'time': elapsed,
-                'throughput': throughput,
-                'latency_ns': latency_ns,
-                'speedup': speedup,
-                'efficiency': efficiency,
-                'price': result.price
-            })
+            threading[i] = (dtype, n_threads, elapsed, throughput, latency_ns,
+                            speedup, efficiency, result.price, result.std_error)
             
-            print(f"{n_threads:<8} {elapsed:<10.3f} {format_number(throughput) + ' p/s':<15} "
-                  f"{latency_ns:<15.2f} {speedup:<10.2f} {efficiency:<12.1f} {result.price:<12.6f}")
+            rows.append(THREADING_ROW_FMT.format(dtype, n_threads, elapsed, format_number(throughput) + ' p/s',
+                                                 latency_ns, speedup, efficiency, result.price,
+                                                 result.std_error))
         
-        # Analysis
-        print("\n" + "-" * 80)
-        best = max(self.results['threading'], key=lambda x: x['throughput'])
-        print(f"Best Performance: {best['threads']} threads at {format_number(best['throughput'])} paths/sec")
-        print(f"Maximum Speedup: {max(r['speedup'] for r in self.results['threading']):.2f}x")
-        print(f"Best Efficiency: {max(r['efficiency'] for r in self.results['threading']):.1f}%")
+        _write_rows(rows)
+        self.results['threading'] = threading
         
-    def analyze_path_convergence(self, thread_count=8):
-        """Analyze convergence and accuracy vs path count"""
+        # Analysis
+        print("\n" + "-" * 104)
+        best = threading[threading['throughput'].argmax()]
+        print(f"Best Performance: {best['threads']} threads ({best['precision']}) at {format_number(best['throughput'])} paths/sec")
+        print(f"Maximum Speedup: {threading['speedup'].max():.2f}x")
+        print(f"Best Efficiency: {threading['efficiency'].max():.1f}%")
+        
+    def analyze_path_convergence(self, thread_count=8, repeats=1):
+        """Analyze convergence and accuracy vs path count (best of `repeats` checkpointed runs)"""
         print("\n" + "=" * 80)
         print("PATH COUNT CONVERGENCE ANALYSIS")
         print("=" * 80)
@@ -122,25 +156,23 @@ class PerformanceAnalyzer:
         config.use_antithetic = True
         config.n_threads = thread_count
         
-        analytical = self.pricer.analytical_price(config)
+        analytical = self.analytical_price(config)
         print(f"Black-Scholes Analytical Price: {analytical:.6f}")
         print()
         
         path_counts = [10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000, 10_000_000]
         
-        print(f"{'Paths':<12} {'MC Price':<12} {'Error':<12} {'Error %':<10} {'Std Err':<12} {'Time (s)':<10} {'Throughput':<15}")
+        print(f"{'Paths':<12} {'MC Price':<12} {'Error':<12} {'Error %':<10} {'Std Err':<12}")
         print("-" * 80)
         
-        for n_paths in path_counts:
-            config.n_paths = n_paths
-            
-            start = time.perf_counter()
-            result = self.pricer.price_mc_parallel(config)
-            elapsed = time.perf_counter() - start
-            
+        # Every path count is a checkpoint of one run over max(path_counts) paths
+        elapsed, checkpoint_results = time_best_of(
+            lambda: self.pricer.price_mc_parallel_checkpoints(config, path_counts), repeat=repeats)
+        
+        rows = []
+        for n_paths, result in zip(path_counts, checkpoint_results):
             error = abs(result.price - analytical)
             error_pct = (error / analytical) * 100
-            throughput = n_paths / elapsed
             
             self.results['convergence'].append({
                 'n_paths': n_paths,
@@ -148,13 +180,15 @@ class PerformanceAnalyzer:
                 'error': error,
                 'error_pct': error_pct,
                 'std_error': result.std_error,
-                'time': elapsed,
-                'throughput': throughput
             })
             
-            print(f"{format_number(n_paths):<12} {result.price:<12.6f} {error:<12.6f} {error_pct:<10.4f} "
-                  f"{result.std_error:<12.6f} {elapsed:<10.3f} {format_number(throughput) + ' p/s':<15}")
+            rows.append(CONVERGENCE_ROW_FMT.format(format_number(n_paths), result.price, error, error_pct,
+                                                   result.std_error))
+        
+        _write_rows(rows)
         
+        print(f"\nTime (all checkpoints, one {format_number(path_counts[-1])}-path run): {elapsed:.3f}s "
+              f"({format_number(path_counts[-1] / elapsed)} paths/sec)")
         print("\n" + "-" * 80)
         print(f"Convergence to analytical: {analytical:.6f}")
         print(f"Best accuracy: {min(r['error'] for r in self.results['convergence']):.6f} "
@@ -178,7 +212,7 @@ class PerformanceAnalyzer:
         config.option_type = "call"
         config.n_threads = thread_count
         
-        analytical = self.pricer.analytical_price(config)
+        analytical = self.analytical_price(config)
         print(f"Black-Scholes Price: {analytical:.6f}")
         print()
         
@@ -189,18 +223,16 @@ class PerformanceAnalyzer:
             ("Antithetic + Control", True, True),
         ]
         
-        print(f"{'Technique':<28} {'Price':<12} {'Error':<12} {'Std Error':<12} {'VR Factor':<10} {'Time (s)':<10}")
+        print(f"{'Technique':<28} {'Price':<12} {'Error':<12} {'Std Error':<12} {'VR Factor':<10}")
         print("-" * 92)
         
+        # All techniques are priced from one shared set of paths
+        variants = [(use_anti, use_cv) for _, use_anti, use_cv in techniques]
+        elapsed, variant_results = time_best_of(lambda: self.pricer.price_mc_multi(config, variants))
+        
         base_std_error = None
-        for name, use_anti, use_cv in techniques:
-            config.use_antithetic = use_anti
-            config.use_control_variate = use_cv
-            
-            start = time.perf_counter()
-            result = self.pricer.price_mc_parallel(config)
-            elapsed = time.perf_counter() - start
-            
+        rows = []
+        for (name, use_anti, use_cv), result in zip(techniques, variant_results):
             error = abs(result.price - analytical)
             
             if base_std_error is None:
@@ -221,26 +253,32 @@ class PerformanceAnalyzer:
                 'control_expectation': getattr(result, 'control_payoff_analytical', None) if use_cv else None
             })
             
-            print(f"{name:<28} {result.price:<12.6f} {error:<12.6f} {result.std_error:<12.6f} "
-                  f"{vr_factor:<10.2f} {elapsed:<10.3f}")
+            rows.append(VARIANCE_ROW_FMT.format(name, result.price, error, result.std_error, vr_factor))
             
             # Show control variate diagnostics
             if use_cv and result.control_variate_used:
                 if hasattr(result, 'control_beta') and hasattr(result, 'variance_reduction_factor'):
-                    print(f"  {'└─ Control variate:':<28} β={result.control_beta:.2f}, "
-                          f"E[Control]={getattr(result, 'control_payoff_analytical', 0.0):.6f}, "
-                          f"Var.Red.={result.variance_reduction_factor:.2f}x")
-                    print(f"  {'   Note:':<28} β=1.0 means SANITY CHECK (not true variance reduction)")
+                    rows.append(f"  {'└─ Control variate:':<28} β={result.control_beta:.2f}, "
+                                f"E[Control]={getattr(result, 'control_payoff_analytical', 0.0):.6f}, "
+                                f"Var.Red.={result.variance_reduction_factor:.2f}x")
+                    rows.append(f"  {'   Note:':<28} β=1.0 means SANITY CHECK (not true variance reduction)")
                 else:
-                    print(f"  {'└─ Control variate:':<28} Enabled (rebuild module for diagnostics)")
+                    rows.append(f"  {'└─ Control variate:':<28} Enabled (rebuild module for diagnostics)")
+        
+        _write_rows(rows)
         
         print("\n" + "-" * 92)
+        print(f"Time (all {len(variants)} techniques, one path sweep): {elapsed:.3f}s")
         best = min(self.results['variance_reduction'], key=lambda x: x['std_error'])
         print(f"Best Technique: {best['technique']} (Variance Reduction: {best['vr_factor']:.2f}x)")
         print(f"Standard Error Improvement: {base_std_error/best['std_error']:.2f}x")
         
-    def analyze_greeks_accuracy(self, n_paths=1_000_000, thread_count=8):
-        """Analyze Greeks computation accuracy"""
+    def analyze_greeks_accuracy(self, n_paths=1_000_000, thread_count=8, repeats=5,
+                                compare_estimators=False):
+        """Analyze Greeks computation accuracy; optionally the spread and cost of each Greeks estimator"""
+        if compare_estimators and repeats < 2:
+            raise ValueError("compare_estimators needs repeats >= 2 to measure the spread of each Greek")
+        
         print("\n" + "=" * 80)
         print("GREEKS ACCURACY ANALYSIS")
         print("=" * 80)
@@ -258,12 +296,18 @@ class PerformanceAnalyzer:
         config.n_threads = thread_count
         config.use_antithetic = True
         
+        def timed_runs(estimate):
+            """Best-of-`repeats` time of estimate(), and the Greeks of every run"""
+            runs = []
+            elapsed, _ = time_best_of(lambda: runs.append(estimate()), repeat=repeats)
+            return elapsed, runs
+        
+        # Pathwise / likelihood-ratio estimators: every Greek from one path sweep
         print("Computing Greeks (this may take a moment)...")
-        start = time.perf_counter()
-        greeks = self.pricer.compute_greeks(config, use_parallel=True)
-        elapsed = time.perf_counter() - start
+        elapsed, pathwise_runs = timed_runs(lambda: self.pricer.compute_greeks_pathwise(config))
+        greeks = pathwise_runs[-1]
         
-        print(f"\nGreeks Computation Time: {elapsed:.2f}s")
+        print(f"\nGreeks Computation Time (pathwise, one path sweep): {elapsed:.2f}s")
         print()
         print(f"{'Greek':<10} {'Value':<15} {'Description':<50}")
         print("-" * 80)
@@ -281,6 +325,34 @@ class PerformanceAnalyzer:
             'rho': greeks.rho,
             'computation_time': elapsed
         }
+
+        if not compare_estimators:
+            return
+
+        # Bump variance and wall time: the std dev of every Greek across
+        # `repeats` runs on fresh paths is its noise; the pathwise runs timed
+        # above are reused
+        estimators = [
+            ("Bump, independent runs", timed_runs(lambda: self.pricer.compute_greeks(config, use_parallel=True))),
+            ("Bump, common random numbers", timed_runs(lambda: self.pricer.compute_greeks_crn(config))),
+            ("Pathwise / likelihood ratio", (elapsed, pathwise_runs)),
+        ]
+
+        print(f"\nEstimator comparison ({repeats} runs each: best wall time, std dev of each Greek)")
+        print(f"{'Estimator':<28} {'Time (s)':<10} {'Delta':<11} {'Gamma':<11} {'Vega':<11} {'Theta':<11} {'Rho':<11}")
+        print("-" * 95)
+
+        rows = []
+        for label, (best_time, runs) in estimators:
+            spread = np.std([[getattr(run, name) for name in GREEK_NAMES] for run in runs], axis=0, ddof=1)
+
+            rows.append(GREEKS_SPREAD_ROW_FMT.format(label, best_time, *spread))
+            self.results['greeks_estimators'].append({
+                'estimator': label,
+                'time': best_time,
+                **dict(zip(GREEK_NAMES, spread)),
+            })
+        _write_rows(rows)
         
     def analyze_option_types(self, n_paths=1_000_000, thread_count=8):
         """Compare call vs put option pricing"""
@@ -298,35 +370,32 @@ class PerformanceAnalyzer:
         config.n_threads = thread_count
         config.use_antithetic = True
         
-        print(f"{'Type':<10} {'MC Price':<12} {'BS Price':<12} {'Error':<12} {'Std Error':<12} {'CI Width':<12} {'Time (s)':<10}")
+        print(f"{'Type':<10} {'MC Price':<12} {'BS Price':<12} {'Error':<12} {'Std Error':<12} {'CI Width':<12}")
         print("-" * 80)
         
-        for opt_type in ["call", "put"]:
-            config.option_type = opt_type
-            
-            analytical = self.pricer.analytical_price(config)
-            
-            start = time.perf_counter()
-            result = self.pricer.price_mc_parallel(config)
-            elapsed = time.perf_counter() - start
+        # Call and put share one path sweep; price each closed form once
+        analyticals = {opt_type: self.analytical_price(config_with(config, option_type=opt_type))
+                       for opt_type in ["call", "put"]}
+        
+        elapsed, (call_result, put_result) = time_best_of(lambda: self.pricer.price_mc_parallel_both(config))
+        
+        for opt_type, result in [("call", call_result), ("put", put_result)]:
+            analytical = analyticals[opt_type]
             
             error = abs(result.price - analytical)
             ci_width = result.ci_upper - result.ci_lower
             
             print(f"{opt_type.capitalize():<10} {result.price:<12.6f} {analytical:<12.6f} {error:<12.6f} "
-                  f"{result.std_error:<12.6f} {ci_width:<12.6f} {elapsed:<10.3f}")
+                  f"{result.std_error:<12.6f} {ci_width:<12.6f}")
+        
+        print(f"\nTime (call + put, one path sweep): {elapsed:.3f}s")
         
-        # Put-Call Parity Check
+        # Put-Call Parity Check (same paths as the table above)
         print("\n" + "-" * 80)
         print("Put-Call Parity Verification:")
-        config.option_type = "call"
-        call_result = self.pricer.price_mc_parallel(config)
-        config.option_type = "put"
-        put_result = self.pricer.price_mc_parallel(config)
         
-        import math
         parity_lhs = call_result.price - put_result.price
-        parity_rhs = config.S0 - config.K * math.exp(-config.r * config.T)
+        parity_rhs = config.S0 - config.K * _discount(config.r, config.T)
         parity_error = abs(parity_lhs - parity_rhs)
         
         print(f"C - P = {parity_lhs:.6f}")
@@ -339,14 +408,19 @@ class PerformanceAnalyzer:
         print("PERFORMANCE ANALYSIS SUMMARY")
         print("=" * 80)
         
-        if 'threading' in self.results and self.results['threading']:
+        if 'threading' in self.results and len(self.results['threading']):
             print("\n>>> Threading Performance")
-            best_thread = max(self.results['threading'], key=lambda x: x['throughput'])
-            single_thread = next(r for r in self.results['threading'] if r['threads'] == 1)
-            print(f"  Single-threaded: {format_number(single_thread['throughput'])} paths/sec")
-            print(f"  Best multi-threaded: {format_number(best_thread['throughput'])} paths/sec ({best_thread['threads']} threads)")
-            print(f"  Maximum speedup: {best_thread['speedup']:.2f}x")
-            print(f"  Peak efficiency: {max(r['efficiency'] for r in self.results['threading']):.1f}%")
+            threading = self.results['threading']
+            best_thread = threading[threading['throughput'].argmax()]
+            # Compare against the single-threaded row of the same precision
+            same_precision = threading[threading['precision'] == best_thread['precision']]
+            single_thread = same_precision[same_precision['threads'] == 1][0]
+            print(f"  Single-threaded: {format_number(single_thread['throughput'])} paths/sec "
+                  f"({single_thread['precision']})")
+            print(f"  Best multi-threaded: {format_number(best_thread['throughput'])} paths/sec "
+                  f"({best_thread['threads']} threads, {best_thread['precision']})")
+            print(f"  Maximum speedup: {threading['speedup'].max():.2f}x")
+            print(f"  Peak efficiency: {threading['efficiency'].max():.1f}%")
         
         if 'convergence' in self.results and self.results['convergence']:
             print("\n>>> Convergence Analysis")
@@ -371,6 +445,12 @@ class PerformanceAnalyzer:
             print(f"  Delta: {self.results['greeks']['delta']:.6f}")
             print(f"  Gamma: {self.results['greeks']['gamma']:.6f}")
             print(f"  Vega: {self.results['greeks']['vega']:.6f}")
+
+        if 'greeks_estimators' in self.results and self.results['greeks_estimators']:
+            bump, *others = self.results['greeks_estimators']
+            for other in others:
+                print(f"  {other['estimator']}: {bump['time'] / other['time']:.1f}x faster than "
+                      f"{bump['estimator'].lower()}, delta std dev {bump['delta'] / other['delta']:.1f}x lower")
         
         print("\n" + "=" * 80)
 
@@ -1,4 +1,5 @@
 #include "monte_carlo.hpp"
+#include <algorithm>
 #include <cmath>
 #include <stdexcept>
 #include <limits>
@@ -189,6 +190,7 @@ namespace montecarlo
         return result;
     }
 
+    template <typename Real>
     MonteCarloPricer::ThreadWorkerResult
     MonteCarloPricer::thread_worker(const Payoff &payoff,
                                     double S0,
@@ -199,18 +201,21 @@ namespace montecarlo
                                     bool use_antithetic,
                                     bool use_control_variate,
                                     const Payoff *control_payoff,
-                                    uint64_t thread_seed)
+                                    RNG &thread_rng,
+                                    float *terminal_out)
     {
         ThreadWorkerResult result;
         result.sum_product = 0.0;
         result.control_sum_squared = 0.0;
 
-        // Create independent RNG for this thread
-        RNG thread_rng(thread_seed);
-
+        // Normals and terminal prices are simulated in Real (float halves the
+        // draw and exp() cost and doubles SIMD width); payoffs and all
+        // accumulators stay in double so the sums over millions of paths keep
+        // full precision.
         const double discount = std::exp(-r * T);
-        const double drift = (r - 0.5 * sigma * sigma) * T;
-        const double diffusion_scale = sigma * std::sqrt(T);
+        const Real spot = static_cast<Real>(S0);
+        const Real drift = static_cast<Real>((r - 0.5 * sigma * sigma) * T);
+        const Real diffusion_scale = static_cast<Real>(sigma * std::sqrt(T));
 
         // SIMD-friendly batch size (process multiple paths at once)
         constexpr std::size_t BATCH_SIZE = 64;
@@ -221,8 +226,8 @@ namespace montecarlo
             std::size_t remainder = n_paths % BATCH_SIZE;
 
             // Structure-of-Arrays (SoA) layout for SIMD auto-vectorization
-            std::vector<double> Z_batch(BATCH_SIZE);
-            std::vector<double> ST_batch(BATCH_SIZE);
+            std::vector<Real> Z_batch(BATCH_SIZE);
+            std::vector<Real> ST_batch(BATCH_SIZE);
             std::vector<double> payoff_batch(BATCH_SIZE);
             std::vector<double> disc_batch(BATCH_SIZE);
 
@@ -235,7 +240,16 @@ namespace montecarlo
                 // Compute stock prices (vectorizable loop)
                 for (std::size_t i = 0; i < BATCH_SIZE; ++i)
                 {
-                    ST_batch[i] = S0 * std::exp(drift + diffusion_scale * Z_batch[i]);
+                    ST_batch[i] = spot * std::exp(drift + diffusion_scale * Z_batch[i]);
+                }
+
+                if (terminal_out)
+                {
+                    float *out = terminal_out + batch * BATCH_SIZE;
+                    for (std::size_t i = 0; i < BATCH_SIZE; ++i)
+                    {
+                        out[i] = static_cast<float>(ST_batch[i]);
+                    }
                 }
 
                 // Compute payoffs (vectorizable loop)
@@ -274,8 +288,10 @@ namespace montecarlo
             // Process remainder paths
             for (std::size_t i = 0; i < remainder; ++i)
             {
-                double Z = thread_rng.normal();
-                double ST = S0 * std::exp(drift + diffusion_scale * Z);
+                Real Z = static_cast<Real>(thread_rng.normal());
+                Real ST = spot * std::exp(drift + diffusion_scale * Z);
+                if (terminal_out)
+                    terminal_out[n_batches * BATCH_SIZE + i] = static_cast<float>(ST);
                 double payoff_value = payoff(ST);
                 double disc = discount * payoff_value;
                 result.sum += disc;
@@ -303,9 +319,9 @@ namespace montecarlo
             std::size_t remainder_pairs = pairs % BATCH_SIZE_PAIRS;
 
             // Structure-of-Arrays for antithetic pairs
-            std::vector<double> Z_batch(BATCH_SIZE_PAIRS);
-            std::vector<double> ST1_batch(BATCH_SIZE_PAIRS);
-            std::vector<double> ST2_batch(BATCH_SIZE_PAIRS);
+            std::vector<Real> Z_batch(BATCH_SIZE_PAIRS);
+            std::vector<Real> ST1_batch(BATCH_SIZE_PAIRS);
+            std::vector<Real> ST2_batch(BATCH_SIZE_PAIRS);
             std::vector<double> payoff1_batch(BATCH_SIZE_PAIRS);
             std::vector<double> payoff2_batch(BATCH_SIZE_PAIRS);
 
@@ -317,8 +333,19 @@ namespace montecarlo
                 // Compute stock prices for both antithetic paths
                 for (std::size_t i = 0; i < BATCH_SIZE_PAIRS; ++i)
                 {
-                    ST1_batch[i] = S0 * std::exp(drift + diffusion_scale * Z_batch[i]);
-                    ST2_batch[i] = S0 * std::exp(drift + diffusion_scale * (-Z_batch[i]));
+                    ST1_batch[i] = spot * std::exp(drift + diffusion_scale * Z_batch[i]);
+                    ST2_batch[i] = spot * std::exp(drift + diffusion_scale * (-Z_batch[i]));
+                }
+
+                // Pair k occupies slots 2k (Z) and 2k+1 (-Z)
+                if (terminal_out)
+                {
+                    float *out = terminal_out + 2 * batch * BATCH_SIZE_PAIRS;
+                    for (std::size_t i = 0; i < BATCH_SIZE_PAIRS; ++i)
+                    {
+                        out[2 * i] = static_cast<float>(ST1_batch[i]);
+                        out[2 * i + 1] = static_cast<float>(ST2_batch[i]);
+                    }
                 }
 
                 // Compute payoffs
@@ -358,16 +385,23 @@ namespace montecarlo
             // Process remainder pairs
             for (std::size_t i = 0; i < remainder_pairs; ++i)
             {
-                double Z = thread_rng.normal();
+                Real Z = static_cast<Real>(thread_rng.normal());
 
-                double ST1 = S0 * std::exp(drift + diffusion_scale * Z);
+                Real ST1 = spot * std::exp(drift + diffusion_scale * Z);
                 double payoff1 = payoff(ST1);
                 double disc1 = discount * payoff1;
 
-                double ST2 = S0 * std::exp(drift + diffusion_scale * (-Z));
+                Real ST2 = spot * std::exp(drift + diffusion_scale * (-Z));
                 double payoff2 = payoff(ST2);
                 double disc2 = discount * payoff2;
 
+                if (terminal_out)
+                {
+                    std::size_t pair_index = n_batches * BATCH_SIZE_PAIRS + i;
+                    terminal_out[2 * pair_index] = static_cast<float>(ST1);
+                    terminal_out[2 * pair_index + 1] = static_cast<float>(ST2);
+                }
+
                 double pair_avg = (disc1 + disc2) / 2.0;
                 result.sum += pair_avg;
                 result.sum_squared += pair_avg * pair_avg;
@@ -386,8 +420,10 @@ namespace montecarlo
             // Handle odd path
             if (has_odd)
             {
-                double Z = thread_rng.normal();
-                double ST = S0 * std::exp(drift + diffusion_scale * Z);
+                Real Z = static_cast<Real>(thread_rng.normal());
+                Real ST = spot * std::exp(drift + diffusion_scale * Z);
+                if (terminal_out)
+                    terminal_out[2 * pairs] = static_cast<float>(ST);
                 double payoff_value = payoff(ST);
                 double disc = discount * payoff_value;
                 result.sum += disc;
@@ -420,47 +456,52 @@ namespace montecarlo
                                                         bool use_control_variate,
                                                         const Payoff *control_payoff,
                                                         double control_payoff_analytical,
-                                                        std::size_t n_threads)
+                                                        std::size_t n_threads,
+                                                        float *terminal_out,
+                                                        Precision precision)
     {
         PricingResult result;
         result.samples = n_paths;
         if (n_paths == 0)
             return result;
 
-        // Determine number of threads
-        if (n_threads == 0)
-            n_threads = std::thread::hardware_concurrency();
-        if (n_threads == 0)
-            n_threads = 4;  // fallback
+        n_threads = resolve_thread_count(n_threads);
 
         // Distribute paths among threads
         std::size_t paths_per_thread = n_paths / n_threads;
         std::size_t remainder = n_paths % n_threads;
 
         // Create thread-safe RNG with different seeds for each thread
-        std::random_device rd;
-        std::vector<uint64_t> thread_seeds(n_threads);
-        for (std::size_t i = 0; i < n_threads; ++i)
-        {
-            thread_seeds[i] = rd() + i * 12345;
-        }
+        std::vector<uint64_t> thread_seeds = make_thread_seeds(n_threads);
 
         // Launch threads and collect results
         std::vector<std::thread> threads;
         std::vector<ThreadWorkerResult> thread_results(n_threads);
 
+        std::size_t path_offset = 0;
         for (std::size_t i = 0; i < n_threads; ++i)
         {
             std::size_t this_n_paths = paths_per_thread + (i < remainder ? 1 : 0);
+            // Each thread writes its terminal prices to its own contiguous slice
+            float *this_terminal_out = terminal_out ? terminal_out + path_offset : nullptr;
+            path_offset += this_n_paths;
 
             threads.emplace_back([this, &payoff, S0, r, sigma, T, this_n_paths,
                                   use_antithetic, use_control_variate, control_payoff,
-                                  &thread_results, i, &thread_seeds]()
+                                  &thread_results, i, &thread_seeds, this_terminal_out, precision]()
             {
-                thread_results[i] = thread_worker(payoff, S0, r, sigma, T,
-                                                   this_n_paths, use_antithetic,
-                                                   use_control_variate, control_payoff,
-                                                   thread_seeds[i]);
+                // Independent RNG for this thread
+                RNG thread_rng(thread_seeds[i]);
+                if (precision == Precision::Float32)
+                    thread_results[i] = thread_worker<float>(payoff, S0, r, sigma, T,
+                                                              this_n_paths, use_antithetic,
+                                                              use_control_variate, control_payoff,
+                                                              thread_rng, this_terminal_out);
+                else
+                    thread_results[i] = thread_worker<double>(payoff, S0, r, sigma, T,
+                                                               this_n_paths, use_antithetic,
+                                                               use_control_variate, control_payoff,
+                                                               thread_rng, this_terminal_out);
             });
         }
 
@@ -469,28 +510,549 @@ namespace montecarlo
             t.join();
 
         // Reduce partial sums from all threads
-        double sum = 0.0;
-        double sum_squared = 0.0;
-        double control_sum = 0.0;
-        double sum_product = 0.0;
-        double control_sum_squared = 0.0;
-        std::size_t effective_samples = 0;
+        return finalize_result(reduce_thread_results(thread_results), n_paths,
+                               confidence_level, use_control_variate && control_payoff,
+                               control_payoff_analytical);
+    }
+
+    std::vector<PricingResult> MonteCarloPricer::price_by_mc_parallel_multi(const Payoff &payoff,
+                                                                          double S0,
+                                                                          double r,
+                                                                          double sigma,
+                                                                          double T,
+                                                                          std::size_t n_paths,
+                                                                          const std::vector<EstimatorVariant> &variants,
+                                                                          double confidence_level,
+                                                                          const Payoff *control_payoff,
+                                                                          double control_payoff_analytical,
+                                                                          std::size_t n_threads,
+                                                                          Precision precision)
+    {
+        std::vector<PricingResult> results(variants.size());
+        for (auto &result : results)
+            result.samples = n_paths;
+        if (n_paths == 0 || variants.empty())
+            return results;
+
+        n_threads = resolve_thread_count(n_threads);
+        std::size_t paths_per_thread = n_paths / n_threads;
+        std::size_t remainder = n_paths % n_threads;
+        std::vector<uint64_t> thread_seeds = make_thread_seeds(n_threads);
+
+        std::vector<std::thread> threads;
+        std::vector<VariantWorkerResult> thread_results(n_threads);
+
+        for (std::size_t i = 0; i < n_threads; ++i)
+        {
+            std::size_t this_n_paths = paths_per_thread + (i < remainder ? 1 : 0);
+
+            threads.emplace_back([this, &payoff, S0, r, sigma, T, this_n_paths, control_payoff,
+                                  &thread_results, i, &thread_seeds, precision]()
+            {
+                if (precision == Precision::Float32)
+                    thread_results[i] = variant_thread_worker<float>(payoff, S0, r, sigma, T, this_n_paths,
+                                                                     control_payoff, thread_seeds[i]);
+                else
+                    thread_results[i] = variant_thread_worker<double>(payoff, S0, r, sigma, T, this_n_paths,
+                                                                      control_payoff, thread_seeds[i]);
+            });
+        }
+
+        for (auto &t : threads)
+            t.join();
+
+        std::vector<ThreadWorkerResult> standard_parts, antithetic_parts;
+        for (const auto &thread_result : thread_results)
+        {
+            standard_parts.push_back(thread_result.standard);
+            antithetic_parts.push_back(thread_result.antithetic);
+        }
+        const ThreadWorkerResult standard = reduce_thread_results(standard_parts);
+        const ThreadWorkerResult antithetic = reduce_thread_results(antithetic_parts);
+
+        // Control variate on/off only changes the final reduction, not the sums
+        for (std::size_t v = 0; v < variants.size(); ++v)
+        {
+            results[v] = finalize_result(variants[v].use_antithetic ? antithetic : standard, n_paths,
+                                         confidence_level,
+                                         variants[v].use_control_variate && control_payoff,
+                                         control_payoff_analytical);
+        }
+        return results;
+    }
+
+    template <typename Real>
+    MonteCarloPricer::VariantWorkerResult
+    MonteCarloPricer::variant_thread_worker(const Payoff &payoff,
+                                            double S0,
+                                            double r,
+                                            double sigma,
+                                            double T,
+                                            std::size_t n_paths,
+                                            const Payoff *control_payoff,
+                                            uint64_t thread_seed)
+    {
+        VariantWorkerResult result;
+        RNG thread_rng(thread_seed);
+
+        const double discount = std::exp(-r * T);
+        const Real spot = static_cast<Real>(S0);
+        const Real drift = static_cast<Real>((r - 0.5 * sigma * sigma) * T);
+        const Real diffusion_scale = static_cast<Real>(sigma * std::sqrt(T));
+        // S_T(-Z) = S0^2 * exp(2 * drift) / S_T(Z), so the antithetic leg costs a division, not an exp()
+        const Real mirror_scale = static_cast<Real>(S0 * S0 * std::exp(2.0 * (r - 0.5 * sigma * sigma) * T));
+
+        auto accumulate = [control_payoff](ThreadWorkerResult &acc, double disc, double disc_control)
+        {
+            acc.sum += disc;
+            acc.sum_squared += disc * disc;
+            if (control_payoff)
+            {
+                acc.control_sum += disc_control;
+                acc.sum_product += disc * disc_control;
+                acc.control_sum_squared += disc_control * disc_control;
+            }
+            ++acc.effective_samples;
+        };
+
+        // Standard MC uses every draw. Antithetic MC pairs draw 2k with its mirror
+        // (matching the n_paths / 2 pairs of the dedicated kernel) and keeps a
+        // trailing odd draw as a single sample.
+        auto process_path = [&](std::size_t j, Real ST)
+        {
+            double disc = discount * payoff(ST);
+            double disc_control = control_payoff ? discount * (*control_payoff)(ST) : 0.0;
+            accumulate(result.standard, disc, disc_control);
+
+            if (j % 2 != 0)
+                return;
+            if (j + 1 < n_paths)
+            {
+                Real ST_anti = mirror_scale / ST;
+                double disc_anti = discount * payoff(ST_anti);
+                double pair_avg = (disc + disc_anti) / 2.0;
+                double control_pair_avg = control_payoff
+                    ? (disc_control + discount * (*control_payoff)(ST_anti)) / 2.0
+                    : 0.0;
+                accumulate(result.antithetic, pair_avg, control_pair_avg);
+            }
+            else
+            {
+                accumulate(result.antithetic, disc, disc_control);
+            }
+        };
+
+        constexpr std::size_t BATCH_SIZE = 64;
+        std::size_t n_batches = n_paths / BATCH_SIZE;
+        std::size_t remainder = n_paths % BATCH_SIZE;
+
+        std::vector<Real> Z_batch(BATCH_SIZE);
+        std::vector<Real> ST_batch(BATCH_SIZE);
+
+        for (std::size_t batch = 0; batch < n_batches; ++batch)
+        {
+            thread_rng.normal_batch(Z_batch.data(), BATCH_SIZE);
+
+            // Compute stock prices (vectorizable loop)
+            for (std::size_t i = 0; i < BATCH_SIZE; ++i)
+            {
+                ST_batch[i] = spot * std::exp(drift + diffusion_scale * Z_batch[i]);
+            }
+
+            for (std::size_t i = 0; i < BATCH_SIZE; ++i)
+            {
+                process_path(batch * BATCH_SIZE + i, ST_batch[i]);
+            }
+        }
+
+        for (std::size_t i = 0; i < remainder; ++i)
+        {
+            Real Z = static_cast<Real>(thread_rng.normal());
+            process_path(n_batches * BATCH_SIZE + i, spot * std::exp(drift + diffusion_scale * Z));
+        }
+
+        return result;
+    }
+
+    std::vector<PricingResult> MonteCarloPricer::price_by_mc_parallel_crn(const Payoff &payoff,
+                                                                        const std::vector<MarketScenario> &scenarios,
+                                                                        std::size_t n_paths,
+                                                                        double confidence_level,
+                                                                        bool use_antithetic,
+                                                                        std::size_t n_threads)
+    {
+        return run_crn({&payoff}, scenarios, n_paths, confidence_level, use_antithetic, n_threads);
+    }
+
+    std::vector<PricingResult> MonteCarloPricer::price_by_mc_parallel_payoffs(const std::vector<const Payoff *> &payoffs,
+                                                                            double S0,
+                                                                            double r,
+                                                                            double sigma,
+                                                                            double T,
+                                                                            std::size_t n_paths,
+                                                                            double confidence_level,
+                                                                            bool use_antithetic,
+                                                                            std::size_t n_threads)
+    {
+        return run_crn(payoffs, {MarketScenario{S0, r, sigma, T}}, n_paths, confidence_level,
+                       use_antithetic, n_threads);
+    }
+
+    std::vector<PricingResult> MonteCarloPricer::price_by_mc_parallel_pathwise(const Payoff &payoff,
+                                                                             double S0,
+                                                                             double r,
+                                                                             double sigma,
+                                                                             double T,
+                                                                             std::size_t n_paths,
+                                                                             double confidence_level,
+                                                                             bool use_antithetic,
+                                                                             std::size_t n_threads)
+    {
+        return run_parallel_legs(6, n_paths, confidence_level, n_threads,
+                                 [this, &payoff, S0, r, sigma, T, n_paths, use_antithetic](std::size_t i,
+                                                                                           std::size_t n_threads,
+                                                                                           uint64_t thread_seed)
+                                 {
+                                     return pathwise_thread_worker(payoff, S0, r, sigma, T,
+                                                                   thread_share(n_paths, n_threads, i),
+                                                                   use_antithetic, thread_seed);
+                                 });
+    }
+
+    std::vector<PricingResult> MonteCarloPricer::run_crn(const std::vector<const Payoff *> &payoffs,
+                                                         const std::vector<MarketScenario> &scenarios,
+                                                         std::size_t n_paths,
+                                                         double confidence_level,
+                                                         bool use_antithetic,
+                                                         std::size_t n_threads)
+    {
+        return run_parallel_legs(scenarios.size() * payoffs.size(), n_paths, confidence_level, n_threads,
+                                 [this, &payoffs, &scenarios, n_paths, use_antithetic](std::size_t i,
+                                                                                       std::size_t n_threads,
+                                                                                       uint64_t thread_seed)
+                                 {
+                                     return crn_thread_worker(payoffs, scenarios,
+                                                              thread_share(n_paths, n_threads, i),
+                                                              use_antithetic, thread_seed);
+                                 });
+    }
+
+    std::vector<PricingResult> MonteCarloPricer::price_by_mc_parallel_checkpoints(const Payoff &payoff,
+                                                                                double S0,
+                                                                                double r,
+                                                                                double sigma,
+                                                                                double T,
+                                                                                const std::vector<std::size_t> &checkpoints,
+                                                                                double confidence_level,
+                                                                                bool use_antithetic,
+                                                                                std::size_t n_threads,
+                                                                                Precision precision)
+    {
+        const std::size_t n_paths = checkpoints.empty() ? 0 : checkpoints.back();
+
+        // Thread i simulates its share of each checkpoint as one more segment on
+        // the same RNG stream, snapshotting its running sums after every segment
+        auto results = run_parallel_legs(
+            checkpoints.size(), n_paths, confidence_level, n_threads,
+            [this, &payoff, S0, r, sigma, T, &checkpoints, use_antithetic, precision](std::size_t i,
+                                                                                    std::size_t n_threads,
+                                                                                    uint64_t thread_seed)
+            {
+                RNG thread_rng(thread_seed);
+                std::vector<ThreadWorkerResult> snapshots;
+                ThreadWorkerResult running;
+                std::size_t done = 0;
+                for (std::size_t checkpoint : checkpoints)
+                {
+                    const std::size_t share = thread_share(checkpoint, n_threads, i);
+                    const std::size_t segment = share - done;
+                    ThreadWorkerResult part =
+                        precision == Precision::Float32
+                            ? thread_worker<float>(payoff, S0, r, sigma, T, segment, use_antithetic,
+                                                   false, nullptr, thread_rng, nullptr)
+                            : thread_worker<double>(payoff, S0, r, sigma, T, segment, use_antithetic,
+                                                    false, nullptr, thread_rng, nullptr);
+                    running = reduce_thread_results({running, part});
+                    snapshots.push_back(running);
+                    done = share;
+                }
+                return snapshots;
+            });
+
+        for (std::size_t k = 0; k < checkpoints.size(); ++k)
+            results[k].samples = checkpoints[k];
+        return results;
+    }
+
+    std::vector<PricingResult> MonteCarloPricer::run_parallel_legs(std::size_t n_legs,
+                                                                   std::size_t n_paths,
+                                                                   double confidence_level,
+                                                                   std::size_t n_threads,
+                                                                   const LegWorker &worker)
+    {
+        std::vector<PricingResult> results(n_legs);
+        for (auto &result : results)
+            result.samples = n_paths;
+        if (n_paths == 0 || n_legs == 0)
+            return results;
+
+        n_threads = resolve_thread_count(n_threads);
+        std::vector<uint64_t> thread_seeds = make_thread_seeds(n_threads);
+
+        std::vector<std::thread> threads;
+        std::vector<std::vector<ThreadWorkerResult>> thread_results(n_threads);
+
+        for (std::size_t i = 0; i < n_threads; ++i)
+        {
+            threads.emplace_back([&worker, &thread_results, i, n_threads, &thread_seeds]()
+            {
+                thread_results[i] = worker(i, n_threads, thread_seeds[i]);
+            });
+        }
+
+        for (auto &t : threads)
+            t.join();
+
+        for (std::size_t leg = 0; leg < n_legs; ++leg)
+        {
+            std::vector<ThreadWorkerResult> parts;
+            for (const auto &thread_result : thread_results)
+                parts.push_back(thread_result[leg]);
+            results[leg] = finalize_result(reduce_thread_results(parts), n_paths,
+                                           confidence_level, false, 0.0);
+        }
+        return results;
+    }
+
+    std::vector<MonteCarloPricer::ThreadWorkerResult>
+    MonteCarloPricer::crn_thread_worker(const std::vector<const Payoff *> &payoffs,
+                                        const std::vector<MarketScenario> &scenarios,
+                                        std::size_t n_paths,
+                                        bool use_antithetic,
+                                        uint64_t thread_seed)
+    {
+        const std::size_t n_scenarios = scenarios.size();
+        const std::size_t n_payoffs = payoffs.size();
+        std::vector<ThreadWorkerResult> results(n_scenarios * n_payoffs);
+        RNG thread_rng(thread_seed);
+
+        std::vector<double> discount(n_scenarios);
+        std::vector<double> drift(n_scenarios);
+        std::vector<double> diffusion_scale(n_scenarios);
+        for (std::size_t s = 0; s < n_scenarios; ++s)
+        {
+            const MarketScenario &sc = scenarios[s];
+            discount[s] = std::exp(-sc.r * sc.T);
+            drift[s] = (sc.r - 0.5 * sc.sigma * sc.sigma) * sc.T;
+            diffusion_scale[s] = sc.sigma * std::sqrt(sc.T);
+        }
+
+        // With antithetic sampling each draw is a (Z, -Z) pair counted as one sample;
+        // a trailing odd path is a single plain sample, as in thread_worker
+        const std::size_t n_draws = use_antithetic ? n_paths / 2 : n_paths;
+        const bool has_odd = use_antithetic && (n_paths % 2) != 0;
+
+        constexpr std::size_t BATCH_SIZE = 64;
+        std::vector<double> Z_batch(BATCH_SIZE);
+        std::vector<double> ST_batch(BATCH_SIZE);
+        std::vector<double> ST_anti_batch(BATCH_SIZE);
+
+        auto accumulate = [&](std::size_t count, bool antithetic)
+        {
+            for (std::size_t s = 0; s < n_scenarios; ++s)
+            {
+                const double spot = scenarios[s].S0;
+
+                // Compute stock prices once per scenario (vectorizable loop)
+                for (std::size_t i = 0; i < count; ++i)
+                {
+                    ST_batch[i] = spot * std::exp(drift[s] + diffusion_scale[s] * Z_batch[i]);
+                }
+                if (antithetic)
+                {
+                    for (std::size_t i = 0; i < count; ++i)
+                    {
+                        ST_anti_batch[i] = spot * std::exp(drift[s] - diffusion_scale[s] * Z_batch[i]);
+                    }
+                }
+
+                // Every payoff reuses the same terminal prices
+                for (std::size_t p = 0; p < n_payoffs; ++p)
+                {
+                    const Payoff &payoff = *payoffs[p];
+                    ThreadWorkerResult &acc = results[s * n_payoffs + p];
+                    for (std::size_t i = 0; i < count; ++i)
+                    {
+                        double disc = discount[s] * payoff(ST_batch[i]);
+                        if (antithetic)
+                            disc = (disc + discount[s] * payoff(ST_anti_batch[i])) / 2.0;
+                        acc.sum += disc;
+                        acc.sum_squared += disc * disc;
+                    }
+                    acc.effective_samples += count;
+                }
+            }
+        };
+
+        for (std::size_t start = 0; start < n_draws; start += BATCH_SIZE)
+        {
+            std::size_t count = std::min(BATCH_SIZE, n_draws - start);
+            thread_rng.normal_batch(Z_batch.data(), count);
+            accumulate(count, use_antithetic);
+        }
+
+        if (has_odd)
+        {
+            Z_batch[0] = thread_rng.normal();
+            accumulate(1, false);
+        }
 
+        return results;
+    }
+
+    std::vector<MonteCarloPricer::ThreadWorkerResult>
+    MonteCarloPricer::pathwise_thread_worker(const Payoff &payoff,
+                                             double S0,
+                                             double r,
+                                             double sigma,
+                                             double T,
+                                             std::size_t n_paths,
+                                             bool use_antithetic,
+                                             uint64_t thread_seed)
+    {
+        constexpr std::size_t N_ESTIMATES = 6;  // price, delta, gamma, vega, theta, rho
+        std::vector<ThreadWorkerResult> results(N_ESTIMATES);
+        RNG thread_rng(thread_seed);
+
+        const double sqrt_T = std::sqrt(T);
+        const double discount = std::exp(-r * T);
+        const double drift = (r - 0.5 * sigma * sigma) * T;
+        const double diffusion_scale = sigma * sqrt_T;
+
+        // Discounted per-path estimates for the normal draw Z, with dS_T/dS0 = S_T/S0,
+        // dS_T/dsigma = S_T (sqrt(T) Z - sigma T) and dS_T/dT = S_T (r - sigma^2/2 + sigma Z / (2 sqrt(T)))
+        auto path_estimates = [&](double Z, double *out)
+        {
+            const double ST = S0 * std::exp(drift + diffusion_scale * Z);
+            const double value = payoff(ST);
+            const double slope = payoff.derivative(ST) * ST;
+
+            out[0] = discount * value;
+            out[1] = discount * slope / S0;
+            out[2] = discount * slope / (S0 * S0) * (Z / diffusion_scale - 1.0);
+            out[3] = discount * slope * (sqrt_T * Z - sigma * T);
+            out[4] = discount * (slope * (r - 0.5 * sigma * sigma + sigma * Z / (2.0 * sqrt_T)) - r * value);
+            out[5] = discount * T * (slope - value);
+        };
+
+        auto accumulate = [&](const double *estimates)
+        {
+            for (std::size_t k = 0; k < N_ESTIMATES; ++k)
+            {
+                results[k].sum += estimates[k];
+                results[k].sum_squared += estimates[k] * estimates[k];
+                results[k].effective_samples += 1;
+            }
+        };
+
+        // With antithetic sampling each (Z, -Z) pair counts as one sample and a
+        // trailing odd path as a single plain sample, as in thread_worker
+        const std::size_t n_draws = use_antithetic ? n_paths / 2 : n_paths;
+        const bool has_odd = use_antithetic && (n_paths % 2) != 0;
+
+        constexpr std::size_t BATCH_SIZE = 64;
+        std::vector<double> Z_batch(BATCH_SIZE);
+        double estimates[N_ESTIMATES];
+        double mirror[N_ESTIMATES];
+
+        for (std::size_t start = 0; start < n_draws; start += BATCH_SIZE)
+        {
+            std::size_t count = std::min(BATCH_SIZE, n_draws - start);
+            thread_rng.normal_batch(Z_batch.data(), count);
+            for (std::size_t i = 0; i < count; ++i)
+            {
+                path_estimates(Z_batch[i], estimates);
+                if (use_antithetic)
+                {
+                    path_estimates(-Z_batch[i], mirror);
+                    for (std::size_t k = 0; k < N_ESTIMATES; ++k)
+                        estimates[k] = (estimates[k] + mirror[k]) / 2.0;
+                }
+                accumulate(estimates);
+            }
+        }
+
+        if (has_odd)
+        {
+            path_estimates(thread_rng.normal(), estimates);
+            accumulate(estimates);
+        }
+
+        return results;
+    }
+
+    std::size_t MonteCarloPricer::thread_share(std::size_t n_paths, std::size_t n_threads, std::size_t i)
+    {
+        return n_paths / n_threads + (i < n_paths % n_threads ? 1 : 0);
+    }
+
+    std::size_t MonteCarloPricer::resolve_thread_count(std::size_t n_threads)
+    {
+        if (n_threads == 0)
+            n_threads = std::thread::hardware_concurrency();
+        if (n_threads == 0)
+            n_threads = 4;  // fallback
+        return n_threads;
+    }
+
+    std::vector<uint64_t> MonteCarloPricer::make_thread_seeds(std::size_t n_threads)
+    {
+        // Drawn from the pricer's RNG so that seeding it also fixes parallel runs
+        std::vector<uint64_t> thread_seeds(n_threads);
+        for (std::size_t i = 0; i < n_threads; ++i)
+        {
+            thread_seeds[i] = rng_.next_u64();
+        }
+        return thread_seeds;
+    }
+
+    MonteCarloPricer::ThreadWorkerResult
+    MonteCarloPricer::reduce_thread_results(const std::vector<ThreadWorkerResult> &thread_results)
+    {
+        ThreadWorkerResult totals;
         for (const auto &thread_result : thread_results)
         {
-            sum += thread_result.sum;
-            sum_squared += thread_result.sum_squared;
-            control_sum += thread_result.control_sum;
-            sum_product += thread_result.sum_product;
-            control_sum_squared += thread_result.control_sum_squared;
-            effective_samples += thread_result.effective_samples;
+            totals.sum += thread_result.sum;
+            totals.sum_squared += thread_result.sum_squared;
+            totals.control_sum += thread_result.control_sum;
+            totals.sum_product += thread_result.sum_product;
+            totals.control_sum_squared += thread_result.control_sum_squared;
+            totals.effective_samples += thread_result.effective_samples;
         }
+        return totals;
+    }
+
+    PricingResult MonteCarloPricer::finalize_result(const ThreadWorkerResult &totals,
+                                                    std::size_t n_paths,
+                                                    double confidence_level,
+                                                    bool use_control_variate,
+                                                    double control_payoff_analytical)
+    {
+        PricingResult result;
+        result.samples = n_paths;
+
+        const double sum = totals.sum;
+        const double sum_squared = totals.sum_squared;
+        const double control_sum = totals.control_sum;
+        const double sum_product = totals.sum_product;
+        const double control_sum_squared = totals.control_sum_squared;
+        const std::size_t effective_samples = totals.effective_samples;
 
         double mean = sum / static_cast<double>(effective_samples);
         double variance_without_cv = 0.0;
 
         // Apply control variate adjustment if enabled
-        if (use_control_variate && control_payoff)
+        if (use_control_variate)
         {
             double control_mean_mc = control_sum / static_cast<double>(effective_samples);
             
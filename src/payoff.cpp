@@ -12,6 +12,11 @@ namespace montecarlo{
         return std::max(spot - strike_, 0.0);
     }
 
+    double EuropeanCall::derivative(double spot) const
+    {
+        return spot > strike_ ? 1.0 : 0.0;
+    }
+
     EuropeanPut::EuropeanPut(double strike)
         : strike_(strike)
     {
@@ -21,4 +26,9 @@ namespace montecarlo{
     {
         return std::max(strike_ - spot, 0.0);
     }
+
+    double EuropeanPut::derivative(double spot) const
+    {
+        return spot < strike_ ? -1.0 : 0.0;
+    }
 }
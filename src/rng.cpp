@@ -6,17 +6,26 @@ namespace montecarlo{
     RNG::RNG(uint64_t seed)
     : engine_(seed),
         uniform_dist_(0.0, std::nextafter(1.0, 2.0)),
-        normal_dist_(0.0, 1.0)
+        normal_dist_(0.0, 1.0),
+        normal_dist_float_(0.0f, 1.0f)
         {}
 
     void RNG::seed(uint64_t seed){
         engine_.seed(seed);
+        // Drop any value the distributions cached from the old stream
+        uniform_dist_.reset();
+        normal_dist_.reset();
+        normal_dist_float_.reset();
     }
 
     double RNG::uniform(){
         return uniform_dist_(engine_);
     }
 
+    uint64_t RNG::next_u64(){
+        return engine_();
+    }
+
     double RNG::normal(){
         return normal_dist_(engine_);
     }
@@ -35,4 +44,10 @@ namespace montecarlo{
             out[i] = normal_dist_(engine_);
         }
     }
+
+    void RNG::normal_batch(float* out, std::size_t n){
+        for (std::size_t i = 0; i < n; ++i) {
+            out[i] = normal_dist_float_(engine_);
+        }
+    }
 }
\ No newline at end of file
@@ -0,0 +1,210 @@
+"""
+Tests for the Numba fallback, and its parity with the C++ extension when built
+
+Run with pytest from the repository root. The parity tests are skipped unless
+montecarlo_pricer._core is importable.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+numba = pytest.importorskip("numba")
+
+from montecarlo_pricer import _numba_fallback as fallback
+
+try:
+    from montecarlo_pricer import _core
+except ImportError:
+    _core = None
+
+requires_core = pytest.mark.skipif(_core is None, reason="C++ extension is not built")
+
+N_PATHS = 200_001  # odd, so the trailing single-path sample is exercised
+N_THREADS = 4
+SEED = 42
+
+
+def make_config(backend, **overrides):
+    config = backend.PricingConfig()
+    config.n_paths = N_PATHS
+    config.n_threads = N_THREADS
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    return config
+
+
+def assert_close(a, b, sigmas=5.0):
+    """Two independent estimates agree within `sigmas` combined standard errors"""
+    assert abs(a.price - b.price) <= sigmas * math.hypot(a.std_error, b.std_error)
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+@pytest.mark.parametrize("use_antithetic", [False, True])
+def test_price_matches_black_scholes(option_type, use_antithetic):
+    config = make_config(fallback, option_type=option_type, use_antithetic=use_antithetic)
+    pricer = fallback.MonteCarloPricer(seed=SEED)
+    analytical = pricer.analytical_price(config)
+
+    for result in (pricer.price_mc(config), pricer.price_mc_parallel(config)):
+        assert result.samples == N_PATHS
+        assert abs(result.price - analytical) <= 5.0 * result.std_error
+        assert result.ci_lower < result.price < result.ci_upper
+
+
+def test_control_variate_reduces_variance():
+    config = make_config(fallback, use_control_variate=True, control_strike=110.0)
+    pricer = fallback.MonteCarloPricer(seed=SEED)
+    result = pricer.price_mc_parallel(config)
+
+    assert result.control_variate_used
+    assert result.variance_reduction_factor > 1.0
+    assert abs(result.price - pricer.analytical_price(config)) <= 5.0 * result.std_error
+
+
+def test_zero_paths_returns_zeroed_result():
+    config = make_config(fallback, n_paths=0)
+    pricer = fallback.MonteCarloPricer(seed=SEED)
+
+    for result in (pricer.price_mc(config), pricer.price_mc_parallel(config),
+                   *pricer.price_mc_multi(config), *pricer.price_mc_parallel_both(config)):
+        assert (result.price, result.std_error, result.samples) == (0.0, 0.0, 0)
+
+
+def test_restores_numba_thread_count():
+    before = numba.get_num_threads()
+    pricer = fallback.MonteCarloPricer(seed=SEED)
+    pricer.price_mc(make_config(fallback))
+    pricer.price_mc_parallel(make_config(fallback, n_threads=1))
+    assert numba.get_num_threads() == before
+
+
+def test_reset_seed_reproduces_parallel_runs():
+    config = make_config(fallback)
+    pricer = fallback.MonteCarloPricer(seed=SEED)
+    first = pricer.price_mc_parallel(config).price
+    pricer.reset_seed(SEED)
+    assert pricer.price_mc_parallel(config).price == first
+
+
+def test_preallocated_writes_every_terminal_price():
+    config = make_config(fallback)
+    pricer = fallback.MonteCarloPricer(seed=SEED)
+    buf = np.zeros(N_PATHS, dtype=np.float32)
+    pricer.price_mc_parallel_preallocated(config, buf)
+    assert np.all(buf > 0.0)
+
+    with pytest.raises(TypeError):
+        pricer.price_mc_parallel_preallocated(config, np.zeros(N_PATHS))
+    with pytest.raises(TypeError):
+        pricer.price_mc_parallel_preallocated(config, np.zeros(2 * N_PATHS, dtype=np.float32)[::2])
+    with pytest.raises(RuntimeError):
+        pricer.price_mc_parallel_preallocated(config, np.zeros(N_PATHS - 1, dtype=np.float32))
+    buf.flags.writeable = False
+    with pytest.raises(RuntimeError):
+        pricer.price_mc_parallel_preallocated(config, buf)
+
+
+def test_single_checkpoint_matches_plain_run():
+    config = make_config(fallback)
+    pricer = fallback.MonteCarloPricer(seed=SEED)
+    (checkpoint,) = pricer.price_mc_parallel_checkpoints(config, [N_PATHS])
+    pricer.reset_seed(SEED)
+    assert checkpoint.price == pricer.price_mc_parallel(config).price
+
+
+def test_rejects_float32():
+    config = make_config(fallback, dtype="float32")
+    pricer = fallback.MonteCarloPricer(seed=SEED)
+    buf = np.zeros(N_PATHS, dtype=np.float32)
+    for method in (pricer.price_mc, pricer.price_mc_parallel, pricer.price_mc_multi,
+                   pricer.price_mc_parallel_both, pricer.price_mc_parallel_checkpoints,
+                   pricer.compute_greeks, pricer.compute_greeks_crn, pricer.compute_greeks_pathwise,
+                   lambda c: pricer.price_mc_parallel_preallocated(c, buf)):
+        with pytest.raises(RuntimeError):
+            method(config)
+
+
+def test_single_sweep_methods_reject_control_variates():
+    config = make_config(fallback, use_control_variate=True)
+    pricer = fallback.MonteCarloPricer(seed=SEED)
+    for method in (pricer.price_mc_parallel_both, pricer.price_mc_parallel_checkpoints,
+                   pricer.compute_greeks_crn, pricer.compute_greeks_pathwise):
+        with pytest.raises(RuntimeError):
+            method(config)
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_pathwise_greeks_match_bump_greeks(option_type):
+    config = make_config(fallback, option_type=option_type)
+    pricer = fallback.MonteCarloPricer(seed=SEED)
+    pathwise = pricer.compute_greeks_pathwise(config)
+    bumped = pricer.compute_greeks_crn(config)
+
+    for name in ("delta", "gamma", "vega", "theta", "rho"):
+        assert getattr(pathwise, name) == pytest.approx(getattr(bumped, name), rel=0.05)
+
+
+@requires_core
+@pytest.mark.parametrize("dtype", ["float32", "bf16"])
+def test_extension_serial_pricing_rejects_non_float64(dtype):
+    config = make_config(_core, dtype=dtype)
+    pricer = _core.MonteCarloPricer(seed=SEED)
+    with pytest.raises(RuntimeError):
+        pricer.price_mc(config)
+    with pytest.raises(RuntimeError):
+        pricer.compute_greeks(config, use_parallel=False)
+
+
+@requires_core
+@pytest.mark.parametrize("method", ["compute_greeks_crn", "compute_greeks_pathwise"])
+def test_extension_greeks_reject_control_variates(method):
+    config = make_config(_core, use_control_variate=True)
+    with pytest.raises(RuntimeError):
+        getattr(_core.MonteCarloPricer(seed=SEED), method)(config)
+
+
+@requires_core
+@pytest.mark.parametrize("overrides", [
+    {},
+    {"option_type": "put", "use_antithetic": False},
+    {"use_control_variate": True, "control_strike": 110.0},
+])
+@pytest.mark.parametrize("method", ["price_mc", "price_mc_parallel"])
+def test_price_parity(method, overrides):
+    expected = getattr(_core.MonteCarloPricer(seed=SEED), method)(make_config(_core, **overrides))
+    actual = getattr(fallback.MonteCarloPricer(seed=SEED), method)(make_config(fallback, **overrides))
+
+    assert actual.samples == expected.samples
+    assert actual.std_error == pytest.approx(expected.std_error, rel=0.05)
+    assert actual.control_variate_used == expected.control_variate_used
+    assert actual.control_payoff_analytical == pytest.approx(expected.control_payoff_analytical)
+    assert_close(actual, expected)
+
+
+@requires_core
+@pytest.mark.parametrize("method, args", [
+    ("price_mc_multi", ()),
+    ("price_mc_parallel_both", ()),
+    ("price_mc_parallel_checkpoints", ([1_000, 10_000, N_PATHS],)),
+])
+def test_sweep_parity(method, args):
+    expected = getattr(_core.MonteCarloPricer(seed=SEED), method)(make_config(_core), *args)
+    actual = getattr(fallback.MonteCarloPricer(seed=SEED), method)(make_config(fallback), *args)
+
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert a.samples == e.samples
+        assert a.std_error == pytest.approx(e.std_error, rel=0.1)
+        assert_close(a, e)
+
+
+@requires_core
+@pytest.mark.parametrize("method", ["compute_greeks_crn", "compute_greeks_pathwise"])
+def test_greeks_parity(method):
+    expected = getattr(_core.MonteCarloPricer(seed=SEED), method)(make_config(_core))
+    actual = getattr(fallback.MonteCarloPricer(seed=SEED), method)(make_config(fallback))
+
+    for name in ("delta", "gamma", "vega", "theta", "rho"):
+        assert getattr(actual, name) == pytest.approx(getattr(expected, name), rel=0.05)